@@ -0,0 +1,34 @@
+"""Add token_hash to refresh tokens
+
+Revision ID: a3f1c9d2b7e4
+Revises: 589e69df03bc
+Create Date: 2026-10-15 23:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3f1c9d2b7e4'
+down_revision: Union[str, None] = '589e69df03bc'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('refresh_tokens', sa.Column('token_hash', sa.String(length=64), nullable=True))
+    op.execute(
+        "UPDATE refresh_tokens SET token_hash = encode(sha256(convert_to(token, 'UTF8')), 'hex') "
+        "WHERE token IS NOT NULL"
+    )
+    op.create_index(op.f('ix_refresh_tokens_token_hash'), 'refresh_tokens', ['token_hash'], unique=False)
+    op.drop_index(op.f('ix_refresh_tokens_token'), table_name='refresh_tokens')
+
+
+def downgrade() -> None:
+    op.create_index(op.f('ix_refresh_tokens_token'), 'refresh_tokens', ['token'], unique=False)
+    op.drop_index(op.f('ix_refresh_tokens_token_hash'), table_name='refresh_tokens')
+    op.drop_column('refresh_tokens', 'token_hash')
@@ -0,0 +1,33 @@
+"""Add active and user expiry indexes to refresh tokens
+
+Revision ID: b8e2d4f6a1c3
+Revises: a3f1c9d2b7e4
+Create Date: 2026-10-15 23:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8e2d4f6a1c3'
+down_revision: Union[str, None] = 'a3f1c9d2b7e4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index(op.f('ix_refresh_tokens_token_hash'), table_name='refresh_tokens')
+    op.create_index(
+        'ix_refresh_tokens_active', 'refresh_tokens', ['token_hash'], unique=False,
+        postgresql_where=sa.text('revoked = false')
+    )
+    op.create_index('ix_refresh_tokens_user_exp', 'refresh_tokens', ['user_id', 'expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_refresh_tokens_user_exp', table_name='refresh_tokens')
+    op.drop_index('ix_refresh_tokens_active', table_name='refresh_tokens', postgresql_where=sa.text('revoked = false'))
+    op.create_index(op.f('ix_refresh_tokens_token_hash'), 'refresh_tokens', ['token_hash'], unique=False)
@@ -0,0 +1,51 @@
+"""Store auth and token types as strings
+
+Revision ID: c5a7e9b1d3f2
+Revises: b8e2d4f6a1c3
+Create Date: 2026-10-15 23:55:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5a7e9b1d3f2'
+down_revision: Union[str, None] = 'b8e2d4f6a1c3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Native enums stored member names ('LOCAL'); the string columns store enum values ('local')
+    op.alter_column(
+        'users', 'auth_type',
+        type_=sa.String(length=16),
+        postgresql_using='lower(auth_type::text)'
+    )
+    op.alter_column(
+        'refresh_tokens', 'token_type',
+        type_=sa.String(length=16),
+        postgresql_using='lower(token_type::text)'
+    )
+    op.execute('DROP TYPE IF EXISTS authtype')
+    op.execute('DROP TYPE IF EXISTS tokentype')
+
+
+def downgrade() -> None:
+    authtype = sa.Enum('LOCAL', 'GOOGLE', 'MICROSOFT', 'GITHUB', name='authtype')
+    tokentype = sa.Enum('JWT', 'PASETO', name='tokentype')
+    authtype.create(op.get_bind())
+    tokentype.create(op.get_bind())
+    op.alter_column(
+        'users', 'auth_type',
+        type_=authtype,
+        postgresql_using='upper(auth_type)::authtype'
+    )
+    op.alter_column(
+        'refresh_tokens', 'token_type',
+        type_=tokentype,
+        postgresql_using='upper(token_type)::tokentype'
+    )
@@ -0,0 +1,34 @@
+"""Include expires_at in the active refresh token index
+
+Revision ID: d2b4f6a8c0e1
+Revises: c5a7e9b1d3f2
+Create Date: 2026-10-16 00:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2b4f6a8c0e1'
+down_revision: Union[str, None] = 'c5a7e9b1d3f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index('ix_refresh_tokens_active', table_name='refresh_tokens', postgresql_where=sa.text('revoked = false'))
+    op.create_index(
+        'ix_refresh_tokens_active', 'refresh_tokens', ['token_hash'], unique=False,
+        postgresql_where=sa.text('revoked = false'), postgresql_include=['expires_at']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_refresh_tokens_active', table_name='refresh_tokens', postgresql_where=sa.text('revoked = false'))
+    op.create_index(
+        'ix_refresh_tokens_active', 'refresh_tokens', ['token_hash'], unique=False,
+        postgresql_where=sa.text('revoked = false')
+    )
@@ -1,14 +1,24 @@
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 
-from fastapi import FastAPI, Request
+from fastapi import FastAPI
 from fastapi.middleware import Middleware
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from starlette.middleware.sessions import SessionMiddleware
+from sqlalchemy.exc import SQLAlchemyError
 from auth.routes import router as auth_router
-from db.pg_connection import get_db, engine
+from auth.utils import purge_refresh_tokens_periodically
+from db.pg_connection import SessionLocal, engine
 from config.settings import settings
 from utils.custom_logger import logger
-from utils.utilities import get_auth_instance
+from utils.utilities import get_auth_instance, build_oauth_client, build_oauth_transport, load_oauth_metadata
+from utils.exceptions import BaseAppException
+from utils.error_handlers import (
+    app_exception_handler,
+    sqlalchemy_exception_handler,
+    unhandled_exception_handler
+)
 from utils.permission_middleware import PermissionMiddleware, build_permissions, initialize_roles
 from db.redis_connection import RedisClient
 
@@ -17,40 +27,40 @@ from teams.routes import router as teams_router
 from roles.routes import router as roles_router
 from permissions.routes import router as perm_router
 from context.routes import router as context_router
-from starlette.middleware.base import BaseHTTPMiddleware
-
-class DBSessionMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        db_session = None
-        db_gen = None
-        try:
-            # Get database session using the dependency
-            db_gen = get_db()
-            db_session = await anext(db_gen)
-            request.state.db = db_session
-            response = await call_next(request)
-            return response
-        except Exception as e:
-            # If there's an error and we have a session, roll it back
-            if db_session:
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+class DBSessionMiddleware:
+    """
+    Pure ASGI middleware that opens a database session per HTTP request and exposes it as request.state.db.
+    Avoids BaseHTTPMiddleware's extra task and memory stream around every request.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async with SessionLocal() as db_session:
+            scope.setdefault("state", {})["db"] = db_session
+            try:
+                await self.app(scope, receive, send)
+            except Exception:
+                # Roll back anything left pending before the session is closed
                 await db_session.rollback()
-            raise e
-        finally:
-            # Always close the session if we created one
-            if db_session:
-                await db_session.close()
-            if db_gen is not None:
-                await db_gen.aclose()
+                raise
 
 
 def make_middleware() -> list[Middleware]:
     middleware = [
         Middleware(
             CORSMiddleware,
-            allow_origins=["*"],
+            allow_origins=settings.cors_origins,
             allow_credentials=True,
-            allow_methods=["*"],
-            allow_headers=["*"],
+            allow_methods=settings.cors_methods,
+            allow_headers=settings.cors_headers,
         ),
         Middleware(
             SessionMiddleware,
@@ -71,24 +81,49 @@ def init_routers(app_: FastAPI) -> None:
     app_.include_router(roles_router)
 
 
+def init_exception_handlers(app_: FastAPI) -> None:
+    app_.add_exception_handler(BaseAppException, app_exception_handler)
+    app_.add_exception_handler(SQLAlchemyError, sqlalchemy_exception_handler)
+    app_.add_exception_handler(Exception, unhandled_exception_handler)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Startup
-    await build_permissions()
-    await initialize_roles()
-    settings.auth_instance = await get_auth_instance()
-    await RedisClient().connect()
+    # Startup: these tasks are independent of each other, so run them concurrently
+    settings.redis_client = RedisClient()
+    _, _, settings.auth_instance, _ = await asyncio.gather(
+        build_permissions(),
+        initialize_roles(),
+        get_auth_instance(),
+        settings.redis_client.connect(),
+    )
+    # One keep-alive pool serves every provider call instead of a new TLS handshake per login
+    oauth_transport = build_oauth_transport()
+    app.state.oauth = build_oauth_client(oauth_transport)
+    # Load OpenID metadata up front (from Redis when another worker already fetched it);
+    # on failure authlib falls back to loading it on first use
+    metadata_results = await asyncio.gather(
+        load_oauth_metadata(app.state.oauth, 'google', settings.redis_client),
+        load_oauth_metadata(app.state.oauth, 'microsoft', settings.redis_client),
+        return_exceptions=True,
+    )
+    for result in metadata_results:
+        if isinstance(result, Exception):
+            logger.error("Error loading OAuth provider metadata: %s", result)
+    purge_task = asyncio.create_task(purge_refresh_tokens_periodically())
     yield
     # Shutdown
-    try:
-        # Dispose of the database engine to close all connections
-        await engine.dispose()
-        # Close Redis connection
-        redis_client = RedisClient()
-        if hasattr(redis_client, 'redis') and redis_client.redis:
-            await redis_client.redis.close()
-    except Exception as e:
-        logger.error(f"Error during shutdown: {e}")
+    purge_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await purge_task
+    redis_client = settings.redis_client
+    shutdown_tasks = [engine.dispose(), oauth_transport.close_pool()]
+    if redis_client is not None and redis_client.redis:
+        shutdown_tasks.append(redis_client.redis.close())
+    results = await asyncio.gather(*shutdown_tasks, return_exceptions=True)
+    for result in results:
+        if isinstance(result, Exception):
+            logger.error("Error during shutdown: %s", result)
 
 
 def create_app() -> FastAPI:
@@ -96,10 +131,12 @@ def create_app() -> FastAPI:
         title="Auth",
         description="Authentication & Authorization",
         version="1.0.0",
+        default_response_class=ORJSONResponse,
         middleware=make_middleware(),
         lifespan=lifespan
     )
     init_routers(app_=app_)
+    init_exception_handlers(app_=app_)
 
     return app_
 
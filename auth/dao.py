@@ -1,12 +1,56 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import update
+from sqlalchemy import update, insert, delete, bindparam, func, literal, or_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.engine import Row
+from datetime import datetime
 from typing import Optional
 
-from auth.models import User, RefreshToken
+from auth.models import User, RefreshToken, TokenType
 from utils.encryption import DataEncryptor  # Assuming DataEncryptor is in utils
 from utils.custom_logger import logger
 
+# Hot lookups are built once and reused so only the bound values change between calls
+_USER_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+_AUTH_ROW_BY_EMAIL = (
+    select(User.id, User.email, User.hashed_password, User.verified)
+    .where(User.email == bindparam("email"))
+)
+_RESET_CONTACT_BY_EMAIL = (
+    select(User.email, User.first_name)
+    .where(User.email == bindparam("email"))
+    .limit(1)
+)
+_REFRESH_TOKEN_BY_TOKEN = (
+    select(RefreshToken)
+    .where(RefreshToken.token_hash == bindparam("token_hash"), RefreshToken.revoked == False)
+)
+_DELETE_ACTIVE_REFRESH_TOKEN = (
+    delete(RefreshToken)
+    .where(RefreshToken.token_hash == bindparam("token_hash"), RefreshToken.revoked == False)
+    .execution_options(synchronize_session=False)
+)
+# expires_at is stored as naive UTC, so compare against the current UTC wall time. Selecting a constant
+# keeps every referenced column inside ix_refresh_tokens_active, allowing an index-only scan.
+_ACTIVE_REFRESH_TOKEN = (
+    select(literal(1))
+    .select_from(RefreshToken)
+    .where(
+        RefreshToken.token_hash == bindparam("token_hash"),
+        RefreshToken.revoked == False,
+        RefreshToken.expires_at > func.timezone("UTC", func.now())
+    )
+    .limit(1)
+)
+
+
+def session_user_cache(db: AsyncSession) -> dict:
+    """
+    Email -> User cache stored on the session. Sessions are request-scoped, so repeated
+    email lookups within one request are served from memory instead of Postgres.
+    """
+    return db.info.setdefault("users_by_email", {})
+
 
 class UserDAO:
     def __init__(self, db: AsyncSession, encryptor: Optional[DataEncryptor] = None):
@@ -14,9 +58,8 @@ class UserDAO:
         self.db = db
 
     async def get_user_by_id(self, user_id: int) -> Optional[User]:
-        """Fetches a user by their ID."""
-        result = await self.db.execute(select(User).where(User.id == user_id))
-        return result.scalars().first()
+        """Fetches a user by their ID, using the session identity map when already loaded."""
+        return await self.db.get(User, user_id)
 
     async def get_user_by_email(self, plain_email: str) -> Optional[User]:
         """
@@ -24,14 +67,14 @@ class UserDAO:
         The email will be encrypted before querying the database.
         """
         encrypted_email = await self.encryptor.encrypt(plain_email)
-        result = await self.db.execute(select(User).where(User.email == encrypted_email))
+        result = await self.db.execute(_USER_BY_EMAIL, {"email": encrypted_email})
         return result.scalars().first()
 
     async def get_user_by_encrypted_email(self, encrypted_email: str) -> Optional[User]:
         """
         Fetches a user by their ENCRYPTED email.
         """
-        result = await self.db.execute(select(User).where(User.email == encrypted_email))
+        result = await self.db.execute(_USER_BY_EMAIL, {"email": encrypted_email})
         return result.scalars().first()
 
 
@@ -44,31 +87,84 @@ class AuthDAO:
     async def get_user_by_email(self, email: str) -> Optional[User]:
         """Get user by email"""
         try:
-            result = await self.db.execute(select(User).where(User.email == email))
-            return result.scalars().first()
+            user_cache = session_user_cache(self.db)
+            if email in user_cache:
+                return user_cache[email]
+            result = await self.db.execute(_USER_BY_EMAIL, {"email": email})
+            user = result.scalars().first()
+            if user is not None:
+                user_cache[email] = user
+            return user
         except Exception as e:
-            logger.error(f"Error getting user by email {email}: {str(e)}")
+            logger.error("Error getting user by email %s: %s", email, e)
+            raise
+
+    async def get_auth_row_by_email(self, email: str) -> Optional[Row]:
+        """
+        Get only the columns needed to authenticate a user.
+        Returns a (id, email, hashed_password, verified) row without ORM hydration.
+        """
+        try:
+            result = await self.db.execute(_AUTH_ROW_BY_EMAIL, {"email": email})
+            return result.one_or_none()
+        except Exception as e:
+            logger.error("Error getting auth row by email %s: %s", email, e)
+            raise
+
+    async def get_reset_contact_by_email(self, email: str) -> Optional[Row]:
+        """
+        Get the (email, first_name) columns needed for a password reset email without ORM hydration.
+        """
+        try:
+            result = await self.db.execute(_RESET_CONTACT_BY_EMAIL, {"email": email})
+            return result.first()
+        except Exception as e:
+            logger.error("Error getting reset contact by email %s: %s", email, e)
             raise
 
     async def get_user_by_id(self, user_id: int) -> Optional[User]:
         """Get user by email"""
         try:
-            result = await self.db.execute(select(User).where(User.id == user_id))
-            return result.scalars().first()
+            return await self.db.get(User, user_id)
         except Exception as e:
-            logger.error(f"Error getting user by email {user_id}: {str(e)}")
+            logger.error("Error getting user by email %s: %s", user_id, e)
             raise
 
     async def create_user(self, user_data: dict) -> User:
-        """Create a new user"""
+        """
+        Create a new user. The primary key comes back from the INSERT's RETURNING and every other
+        column was set locally, so the object is returned without a refresh SELECT.
+        """
         try:
             db_user = User(**user_data)
             self.db.add(db_user)
             await self.db.commit()
-            await self.db.refresh(db_user)
             return db_user
         except Exception as e:
-            logger.error(f"Error creating user: {str(e)}")
+            logger.error("Error creating user: %s", e)
+            await self.db.rollback()
+            raise
+
+    async def create_user_if_absent(self, user_data: dict, commit: bool = True) -> Optional[User]:
+        """
+        Insert a user unless the email is already registered, in a single
+        INSERT ... ON CONFLICT (email) DO NOTHING RETURNING statement.
+        Returns the new user, or None if the email was taken.
+        With commit=False the caller commits, so the insert can share a transaction with later writes.
+        """
+        try:
+            result = await self.db.execute(
+                pg_insert(User)
+                .values(**user_data)
+                .on_conflict_do_nothing(index_elements=[User.email])
+                .returning(User)
+            )
+            db_user = result.scalar_one_or_none()
+            if commit:
+                await self.db.commit()
+            return db_user
+        except Exception as e:
+            logger.error("Error creating user: %s", e)
             await self.db.rollback()
             raise
 
@@ -76,24 +172,81 @@ class AuthDAO:
         """Get refresh token from database"""
         try:
             result = await self.db.execute(
-                select(RefreshToken).where(RefreshToken.token == token)
+                _REFRESH_TOKEN_BY_TOKEN, {"token_hash": RefreshToken.hash_token(token)}
             )
             return result.scalars().first()
         except Exception as e:
-            logger.error(f"Error getting refresh token: {str(e)}")
+            logger.error("Error getting refresh token: %s", e)
+            raise
+
+    async def is_refresh_token_active(self, token: str) -> bool:
+        """Check that a refresh token exists, is not revoked and has not expired, entirely in the database"""
+        try:
+            result = await self.db.execute(
+                _ACTIVE_REFRESH_TOKEN, {"token_hash": RefreshToken.hash_token(token)}
+            )
+            return result.scalar() is not None
+        except Exception as e:
+            logger.error("Error checking refresh token: %s", e)
+            raise
+
+    async def insert_refresh_token(
+        self,
+        token: str,
+        user_email: str,
+        expires_at: datetime,
+        token_type: TokenType,
+        nonce: Optional[str] = None
+    ) -> None:
+        """
+        Insert a refresh token with a single INSERT, resolving user_id from the email in the same statement.
+        The caller owns the transaction and commits it together with the rest of its work.
+        """
+        try:
+            await self.db.execute(
+                insert(RefreshToken).values(
+                    user_id=select(User.id).where(User.email == user_email).scalar_subquery(),
+                    token=token,
+                    token_hash=RefreshToken.hash_token(token),
+                    token_type=token_type,
+                    nonce=nonce,
+                    expires_at=expires_at,
+                    revoked=False
+                )
+            )
+        except Exception as e:
+            logger.error("Error inserting refresh token: %s", e)
             raise
 
     async def delete_refresh_token(self, token: str) -> bool:
-        """Delete refresh token from database"""
+        """Delete refresh token from database with a single DELETE; returns whether a live token was removed"""
         try:
-            refresh_token = await self.get_refresh_token(token)
-            if refresh_token:
-                await self.db.delete(refresh_token)
-                await self.db.commit()
-                return True
-            return False
+            result = await self.db.execute(
+                _DELETE_ACTIVE_REFRESH_TOKEN, {"token_hash": RefreshToken.hash_token(token)}
+            )
+            await self.db.commit()
+            return result.rowcount > 0
+        except Exception as e:
+            logger.error("Error deleting refresh token: %s", e)
+            await self.db.rollback()
+            raise
+
+    async def delete_expired_refresh_tokens(self) -> int:
+        """Delete refresh tokens that are expired or revoked; returns the number of rows removed"""
+        try:
+            # expires_at is stored as naive UTC, so compare against the current UTC wall time
+            result = await self.db.execute(
+                delete(RefreshToken).where(
+                    or_(
+                        RefreshToken.expires_at < func.timezone("UTC", func.now()),
+                        RefreshToken.revoked == True
+                    )
+                )
+            )
+            await self.db.commit()
+            return result.rowcount
         except Exception as e:
-            logger.error(f"Error deleting refresh token: {str(e)}")
+            logger.error("Error deleting expired refresh tokens: %s", e)
             await self.db.rollback()
             raise
 
@@ -108,7 +261,7 @@ class AuthDAO:
             await self.db.commit()
             return result.rowcount > 0
         except Exception as e:
-            logger.error(f"Error updating user verification status: {str(e)}")
+            logger.error("Error updating user verification status: %s", e)
             await self.db.rollback()
             raise
 
@@ -123,6 +276,6 @@ class AuthDAO:
             await self.db.commit()
             return result.rowcount > 0
         except Exception as e:
-            logger.error(f"Error updating user password: {str(e)}")
+            logger.error("Error updating user password: %s", e)
             await self.db.rollback()
             raise
@@ -1,16 +1,91 @@
+import hashlib
+import time
+from typing import Optional
+
+import orjson
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import bindparam
 from sqlalchemy.future import select
 from db.pg_connection import get_db
 from config.settings import settings
 from db.redis_connection import RedisClient
-from auth.models import User
+from auth.models import User, AuthType
+from auth.dao import session_user_cache
 import logging
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 
-async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)):
+_VERIFIED_USER_BY_EMAIL = select(User).where(User.email == bindparam("email"), User.verified == True)
+
+# Upper bound (seconds) for how long a token -> user mapping is cached. The token itself is still verified
+# on every request, so an expired or forged token is never served from here; but a user who is deleted or
+# loses their verified flag keeps being resolved for up to this long on tokens already in use.
+TOKEN_USER_CACHE_TTL = 60
+
+
+async def get_redis_client() -> RedisClient:
+    """Shared Redis client; one connection pool serves every request and background task"""
+    if settings.redis_client is None:
+        settings.redis_client = RedisClient()
+    await settings.redis_client.connect()
+    return settings.redis_client
+
+
+def _token_cache_key(token: str) -> str:
+    """Redis key for a token, so raw tokens are never stored as keys"""
+    return f"jwt:{hashlib.sha256(token.encode()).hexdigest()[:32]}"
+
+
+def _token_cache_ttl(payload: dict) -> int:
+    """Seconds the user mapping may be cached: min(time left on the token, TOKEN_USER_CACHE_TTL)"""
+    exp = payload.get("exp")
+    if exp is None:
+        return TOKEN_USER_CACHE_TTL
+    return max(0, min(int(exp - time.time()), TOKEN_USER_CACHE_TTL))
+
+
+async def _get_cached_user(redis_client: RedisClient, token: str) -> Optional[User]:
+    """Hydrate a detached User from the token cache, or None on miss / Redis error"""
+    try:
+        cached = await redis_client.redis.get(_token_cache_key(token))
+    except Exception as e:
+        logging.error("Token cache lookup failed: %s", e)
+        return None
+    if not cached:
+        return None
+
+    user_data = orjson.loads(cached)
+    user_data["auth_type"] = AuthType(user_data["auth_type"]) if user_data.get("auth_type") else None
+    return User(**user_data)
+
+
+async def _cache_user(redis_client: RedisClient, token: str, payload: dict, user: User) -> None:
+    """Cache the verified user for this token; failures only cost the next request a DB lookup"""
+    ttl = _token_cache_ttl(payload)
+    if ttl <= 0:
+        return
+    user_data = {
+        "id": user.id,
+        "email": user.email,
+        "first_name": user.first_name,
+        "last_name": user.last_name,
+        "phone_number": user.phone_number,
+        "verified": user.verified,
+        "auth_type": user.auth_type.value if user.auth_type else None,
+    }
+    try:
+        await redis_client.redis.setex(_token_cache_key(token), ttl, orjson.dumps(user_data))
+    except Exception as e:
+        logging.error("Token cache write failed: %s", e)
+
+
+async def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_db),
+    redis_client: RedisClient = Depends(get_redis_client)
+):
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials. Please verify if already registered",
@@ -18,6 +93,7 @@ async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession
     )
 
     try:
+        # Repeat verifications are served from the auth backend's payload cache, so this stays cheap
         payload = await settings.auth_instance.verify_token(token)
         if payload is None:
             logging.error("Token verification failed: Payload is None")
@@ -28,17 +104,25 @@ async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession
             logging.error("Token verification failed: Email is None")
             raise credentials_exception
 
+        # A recently resolved token skips the user lookup
+        cached_user = await _get_cached_user(redis_client, token)
+        if cached_user is not None and cached_user.email == email:
+            return cached_user
 
-        user_result = await db.execute(select(User).where(User.email == email, User.verified== True))
+        user_result = await db.execute(_VERIFIED_USER_BY_EMAIL, {"email": email})
         user = user_result.scalars().first()
         if user is None:
             logging.error("User not found or is not verified")
             raise credentials_exception
 
+        # Later lookups of the current user's email in this request can skip Postgres
+        session_user_cache(db)[email] = user
+
+        await _cache_user(redis_client, token, payload, user)
         return user
 
     except Exception as e:
-        logging.error(f"Exception during token verification: {e}")
+        logging.error("Exception during token verification: %s", e)
         raise credentials_exception from e
 
 
@@ -64,7 +148,7 @@ async def get_current_user_email(token: str = Depends(oauth2_scheme)) -> str:
         return email
 
     except Exception as e:
-        logging.error(f"Exception during token verification: {e}")
+        logging.error("Exception during token verification: %s", e)
         raise credentials_exception from e
 
 
@@ -85,11 +169,5 @@ async def get_current_user_token_payload(token: str = Depends(oauth2_scheme)) ->
         return payload
 
     except Exception as e:
-        logging.error(f"Exception during token verification: {e}")
-        raise credentials_exception from e
-
-
-async def get_redis_client() -> RedisClient:
-    redis_client = RedisClient()
-    await redis_client.connect()
-    return redis_client
\ No newline at end of file
+        logging.error("Exception during token verification: %s", e)
+        raise credentials_exception from e
\ No newline at end of file
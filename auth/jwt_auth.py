@@ -1,21 +1,47 @@
+import asyncio
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Any, Optional
-from jose import jwt
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
+import jwt
+import orjson
+from jwt.algorithms import Algorithm
+from jwt.utils import base64url_encode
 from config.settings import settings
 from utils.custom_logger import logger
-from auth.models import RefreshToken, TokenType
+from auth.models import TokenType
+from auth.dao import AuthDAO
 from sqlalchemy.ext.asyncio import AsyncSession
 from utils.base_auth import BaseAuth
 from context.services import ContextService
+from auth.token_cache import VerifiedTokenCache
+
+_verified_tokens = VerifiedTokenCache(maxsize=10000, ttl=30)
+
+
+@lru_cache(maxsize=1)
+def _signer() -> Tuple[bytes, Algorithm, Any]:
+    """Encoded header segment, algorithm backend and prepared key for settings.algorithm, resolved once"""
+    algorithm = jwt.get_algorithm_by_name(settings.algorithm)
+    header_segment = base64url_encode(orjson.dumps({"alg": settings.algorithm, "typ": "JWT"}))
+    return header_segment, algorithm, algorithm.prepare_key(settings.secret_key)
+
+
+def _encode(claims: dict) -> str:
+    """Sign claims with the pre-resolved signer; equivalent to jwt.encode without per-call setup"""
+    header_segment, algorithm, key = _signer()
+    signing_input = header_segment + b"." + base64url_encode(orjson.dumps(claims))
+    return (signing_input + b"." + base64url_encode(algorithm.sign(signing_input, key))).decode()
 
 class JWTAuth(BaseAuth):
-    async def create_access_token(self, data: dict, expires_delta: timedelta):
+    async def create_access_token(self, data: dict, expires_delta: timedelta, now: Optional[float] = None):
         """
         Creates a JSON Web Token (JWT) for access control.
 
         Parameters:
         - data (dict): A dictionary containing the payload data to be encoded in the token.
         - expires_delta (timedelta): A timedelta object representing the duration until the token expires.
+        - now (float, optional): Epoch seconds to compute expiry from; defaults to the current time.
 
         Returns:
         - str: The encoded JWT as a string.
@@ -24,9 +50,8 @@ class JWTAuth(BaseAuth):
         - jwt.exceptions.PyJWTError: If there is an error in encoding the JWT.
         """
         to_encode = data.copy()
-        expire = datetime.now(timezone.utc) + expires_delta
-        to_encode.update({"exp": expire.isoformat()})
-        encoded_jwt = jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
+        to_encode["exp"] = int((now or time.time()) + expires_delta.total_seconds())
+        encoded_jwt = await asyncio.to_thread(_encode, to_encode)
         return encoded_jwt
 
     async def create_context_enriched_token(
@@ -36,7 +61,8 @@ class JWTAuth(BaseAuth):
         expires_delta: timedelta,
         active_organization_id: Optional[int] = None,
         active_team_id: Optional[int] = None,
-        custom_claims: Optional[Dict[str, Any]] = None
+        custom_claims: Optional[Dict[str, Any]] = None,
+        prefetched_context: Optional[Dict[str, Any]] = None
     ) -> str:
         """
         Creates a JWT access token enriched with user's current context (active org/team).
@@ -48,55 +74,58 @@ class JWTAuth(BaseAuth):
         - active_organization_id (int, optional): ID of the active organization
         - active_team_id (int, optional): ID of the active team
         - custom_claims (dict, optional): Additional custom claims
+        - prefetched_context (dict, optional): An already built context payload; skips the context queries
 
         Returns:
         - str: The encoded JWT as a string.
         """
-        context_service = ContextService(db)
-        
-        # Create enriched payload with context
-        payload_data = await context_service.create_context_enriched_payload(
-            user_email=user_email,
-            active_organization_id=active_organization_id,
-            active_team_id=active_team_id,
-            custom_claims=custom_claims
-        )
+        if prefetched_context is not None:
+            payload_data = {**prefetched_context, **(custom_claims or {})}
+        else:
+            context_service = ContextService(db)
+
+            # Create enriched payload with context
+            payload_data = await context_service.create_context_enriched_payload(
+                user_email=user_email,
+                active_organization_id=active_organization_id,
+                active_team_id=active_team_id,
+                custom_claims=custom_claims
+            )
         
         # Add expiration
-        expire = datetime.now(timezone.utc) + expires_delta
-        payload_data.update({"exp": expire.isoformat()})
+        payload_data["exp"] = int(time.time() + expires_delta.total_seconds())
         
-        encoded_jwt = jwt.encode(payload_data, settings.secret_key, algorithm=settings.algorithm)
+        encoded_jwt = await asyncio.to_thread(_encode, payload_data)
         return encoded_jwt
 
-    async def create_refresh_token(self, data: dict, expires_delta: timedelta, db: AsyncSession):
+    async def create_refresh_token(
+        self, data: dict, expires_delta: timedelta, db: AsyncSession, now: Optional[float] = None
+    ):
         """
-        Creates a new refresh token and stores it in the database.
+        Creates a new refresh token and inserts it into the database. The caller commits the transaction.
 
         Parameters:
         - data (dict): A dictionary containing the payload for the token, typically including user information.
         - expires_delta (timedelta): The duration after which the token will expire.
-        - db (AsyncSession): The asynchronous database session used to commit the new token to the database.
+        - db (AsyncSession): The asynchronous database session the new token is inserted with.
+        - now (float, optional): Epoch seconds to compute expiry from; defaults to the current time.
 
         Returns:
         - str: The encoded JWT refresh token.
 
         Raises:
         - jwt.PyJWTError: If there is an error encoding the JWT token.
-        - sqlalchemy.exc.SQLAlchemyError: If there is an error committing the token to the database.
+        - sqlalchemy.exc.SQLAlchemyError: If there is an error inserting the token into the database.
         """
-        expire = datetime.now(timezone.utc) + expires_delta
-        token = jwt.encode(data, settings.secret_key, algorithm=settings.algorithm)
-        db_refresh_token = RefreshToken(
-            user_email=data["sub"],
+        to_encode = data.copy()
+        to_encode["exp"] = int((now or time.time()) + expires_delta.total_seconds())
+        token = await asyncio.to_thread(_encode, to_encode)
+        await AuthDAO(db).insert_refresh_token(
             token=token,
-            token_type=TokenType(settings.auth_mode),
-            nonce=None,
-            expires_at=expire,
-            revoked=False
+            user_email=data["sub"],
+            expires_at=datetime.fromtimestamp(to_encode["exp"], timezone.utc).replace(tzinfo=None),
+            token_type=TokenType(settings.auth_mode)
         )
-        db.add(db_refresh_token)
-        await db.commit()
         return token
 
     async def verify_token(self, token: str):
@@ -108,18 +137,27 @@ class JWTAuth(BaseAuth):
 
         Returns:
         dict or None: Returns the payload of the token as a dictionary if the token is valid and not expired.
-                      Returns None if the token is invalid or expired.
+                      Returns None if the token is invalid, expired or has no numeric "exp" claim.
 
         Raises:
-        jwt.JWTError: If there is an error decoding the token.
+        jwt.InvalidTokenError: If there is an error decoding the token.
         """
+        cached_payload = _verified_tokens.get(token)
+        if cached_payload is not None:
+            return cached_payload
+
         try:
-            payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
-            if "exp" in payload:
-                exp = datetime.fromisoformat(payload["exp"])
-                if exp < datetime.now(timezone.utc):
-                    logger.error("Token has expired.")
-                    return None
+            # Reject malformed or wrong-algorithm tokens from the header alone, before any signature work
+            if jwt.get_unverified_header(token).get("alg") != settings.algorithm:
+                return None
+
+            payload = await asyncio.to_thread(
+                jwt.decode, token, settings.secret_key, algorithms=[settings.algorithm], options={"require": ["exp"]}
+            )
+            _verified_tokens.set(token, payload)
             return payload
-        except jwt.JWTError:
+        except jwt.ExpiredSignatureError:
+            logger.error("Token has expired.")
+            return None
+        except jwt.InvalidTokenError:
             return None 
\ No newline at end of file
@@ -1,6 +1,7 @@
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, DateTime, Enum as SQLAlchemyEnum
+from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, DateTime, Index, text, Enum as SQLAlchemyEnum
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
+import hashlib
 from db.pg_connection import Base
 from enum import Enum
 
@@ -25,7 +26,10 @@ class User(Base):
     phone_number = Column(String, nullable=True)
     email = Column(String, unique=True, index=True)
     hashed_password = Column(String)
-    auth_type = Column(SQLAlchemyEnum(AuthType), default=AuthType.LOCAL)
+    auth_type = Column(
+        SQLAlchemyEnum(AuthType, native_enum=False, length=16, values_callable=lambda e: [m.value for m in e]),
+        default=AuthType.LOCAL
+    )
     verified = Column(Boolean, default=False)
 
     refresh_tokens = relationship("RefreshToken", back_populates="user", foreign_keys="[RefreshToken.user_id]")
@@ -38,10 +42,29 @@ class RefreshToken(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey('users.id'))
-    token = Column(String, index=True)
+    token = Column(String)
+    token_hash = Column(String(64))
     expires_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
     revoked = Column(Boolean, default=False)
-    token_type = Column(SQLAlchemyEnum(TokenType), default=TokenType.JWT)
+    token_type = Column(
+        SQLAlchemyEnum(TokenType, native_enum=False, length=16, values_callable=lambda e: [m.value for m in e]),
+        default=TokenType.JWT
+    )
     nonce = Column(String, nullable=True)
 
     user = relationship("User", back_populates="refresh_tokens", foreign_keys=[user_id])
+
+    __table_args__ = (
+        # Lookups only ever target live tokens, so revoked rows stay out of the index. expires_at is
+        # carried in the index so the refresh check is answered by an index-only scan.
+        Index(
+            'ix_refresh_tokens_active', 'token_hash',
+            postgresql_where=text('revoked = false'), postgresql_include=['expires_at']
+        ),
+        Index('ix_refresh_tokens_user_exp', 'user_id', 'expires_at'),
+    )
+
+    @staticmethod
+    def hash_token(token: str) -> str:
+        """Hex SHA-256 of a token; lookups go through this fixed-size value instead of the raw token"""
+        return hashlib.sha256(token.encode()).hexdigest()
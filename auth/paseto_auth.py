@@ -1,24 +1,44 @@
-import json
+import asyncio
+import orjson
 import secrets
+import time
 from datetime import timedelta, datetime, timezone
+from functools import lru_cache
 from typing import Dict, Any, Optional
 from pyseto import Key, encode, decode
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from config.settings import settings
 from utils.custom_logger import logger
-from auth.models import RefreshToken, TokenType
+from auth.models import TokenType
+from auth.dao import AuthDAO
 from utils.base_auth import BaseAuth
 from context.services import ContextService
+from auth.token_cache import VerifiedTokenCache
+
+_verified_tokens = VerifiedTokenCache(maxsize=10000, ttl=30)
+
+
+@lru_cache(maxsize=1)
+def _signing_key() -> Key:
+    """v2.public signing key, parsed from PEM once on first use"""
+    return Key.new(version=2, key=settings.paseto_private_key, type="public")
+
+
+@lru_cache(maxsize=1)
+def _verification_key() -> Key:
+    """v2.public verification key, parsed from PEM once on first use"""
+    return Key.new(version=2, key=settings.paseto_public_key, type="public")
 
 class PasetoAuth(BaseAuth):
-    async def create_access_token(self, data: dict, expires_delta: timedelta):
+    async def create_access_token(self, data: dict, expires_delta: timedelta, now: Optional[float] = None):
         """
         Asynchronously creates an access token using the PASETO (Platform-Agnostic Security Tokens) standard.
 
         Parameters:
         - data (dict): A dictionary containing the payload data to be included in the token.
         - expires_delta (timedelta): A timedelta object representing the duration after which the token will expire.
+        - now (float, optional): Epoch seconds to compute expiry from; defaults to the current time.
 
         Returns:
         - str: A string representing the encoded access token.
@@ -26,10 +46,9 @@ class PasetoAuth(BaseAuth):
         Raises:
         - Any exceptions related to key creation or token encoding will be propagated.
         """
-        key = Key.new(version=2, key=settings.paseto_private_key, type="public")
-        expire = datetime.now(timezone.utc) + expires_delta
-        data.update({"exp": expire.isoformat()})
-        token = encode(key, json.dumps(data)).decode('utf-8')
+        key = _signing_key()
+        data.update({"exp": int((now or time.time()) + expires_delta.total_seconds())})
+        token = (await asyncio.to_thread(encode, key, orjson.dumps(data))).decode('utf-8')
         return token
 
     async def create_context_enriched_token(
@@ -39,7 +58,8 @@ class PasetoAuth(BaseAuth):
         expires_delta: timedelta,
         active_organization_id: Optional[int] = None,
         active_team_id: Optional[int] = None,
-        custom_claims: Optional[Dict[str, Any]] = None
+        custom_claims: Optional[Dict[str, Any]] = None,
+        prefetched_context: Optional[Dict[str, Any]] = None
     ) -> str:
         """
         Creates a PASETO access token enriched with user's current context (active org/team).
@@ -51,36 +71,42 @@ class PasetoAuth(BaseAuth):
         - active_organization_id (int, optional): ID of the active organization
         - active_team_id (int, optional): ID of the active team
         - custom_claims (dict, optional): Additional custom claims
+        - prefetched_context (dict, optional): An already built context payload; skips the context queries
 
         Returns:
         - str: The encoded PASETO token as a string.
         """
-        context_service = ContextService(db)
-        
-        # Create enriched payload with context
-        payload_data = await context_service.create_context_enriched_payload(
-            user_email=user_email,
-            active_organization_id=active_organization_id,
-            active_team_id=active_team_id,
-            custom_claims=custom_claims
-        )
+        if prefetched_context is not None:
+            payload_data = {**prefetched_context, **(custom_claims or {})}
+        else:
+            context_service = ContextService(db)
+
+            # Create enriched payload with context
+            payload_data = await context_service.create_context_enriched_payload(
+                user_email=user_email,
+                active_organization_id=active_organization_id,
+                active_team_id=active_team_id,
+                custom_claims=custom_claims
+            )
         
         # Add expiration
-        expire = datetime.now(timezone.utc) + expires_delta
-        payload_data.update({"exp": expire.isoformat()})
+        payload_data.update({"exp": int(time.time() + expires_delta.total_seconds())})
         
-        key = Key.new(version=2, key=settings.paseto_private_key, type="public")
-        token = encode(key, json.dumps(payload_data)).decode('utf-8')
+        key = _signing_key()
+        token = (await asyncio.to_thread(encode, key, orjson.dumps(payload_data))).decode('utf-8')
         return token
 
-    async def create_refresh_token(self, data: dict, expires_delta: timedelta, db: AsyncSession):
+    async def create_refresh_token(
+        self, data: dict, expires_delta: timedelta, db: AsyncSession, now: Optional[float] = None
+    ):
         """
-        Asynchronously creates a refresh token for a user and stores it in the database.
+        Asynchronously creates a refresh token for a user and inserts it into the database. The caller commits the transaction.
 
         Parameters:
         - data (dict): A dictionary containing user data, including the subject ('sub') which is the user's email.
         - expires_delta (timedelta): The time duration after which the token will expire.
-        - db (AsyncSession): The asynchronous database session used to add and commit the refresh token.
+        - db (AsyncSession): The asynchronous database session the refresh token is inserted with.
+        - now (float, optional): Epoch seconds to compute expiry from; defaults to the current time.
 
         Returns:
         - str: The generated refresh token as a string.
@@ -88,20 +114,17 @@ class PasetoAuth(BaseAuth):
         Raises:
         - Any exceptions related to database operations or encoding issues may be raised during the execution.
         """
-        key = Key.new(version=2, type="public", key=settings.paseto_private_key)
-        nonce = secrets.token_hex(32)
+        key = _signing_key()
+        nonce = secrets.token_urlsafe(24)
         data.update({"nonce": nonce})
-        token = encode(key, json.dumps(data)).decode('utf-8')
-        db_refresh_token = RefreshToken(
-            user_email=data["sub"],
+        token = (await asyncio.to_thread(encode, key, orjson.dumps(data))).decode('utf-8')
+        await AuthDAO(db).insert_refresh_token(
             token=token,
+            user_email=data["sub"],
+            expires_at=datetime.fromtimestamp((now or time.time()) + expires_delta.total_seconds(), timezone.utc).replace(tzinfo=None),
             token_type=TokenType(settings.auth_mode),
-            nonce=nonce,
-            expires_at=datetime.now(timezone.utc) + expires_delta,
-            revoked=False
+            nonce=nonce
         )
-        db.add(db_refresh_token)
-        await db.commit()
         return token
 
     async def verify_token(self, token: str):
@@ -113,21 +136,24 @@ class PasetoAuth(BaseAuth):
 
         Returns:
         - dict: A dictionary containing the decoded payload if the token is valid and not expired.
-        - None: If the token is invalid or expired.
+        - None: If the token is invalid, expired or has no "exp" claim.
 
         Raises:
         - Exception: Logs an error and returns None if token verification fails for any reason.
         """
+        cached_payload = _verified_tokens.get(token)
+        if cached_payload is not None:
+            return cached_payload
+
         try:
-            key = Key.new(version=2, type="public", key=settings.paseto_public_key)
-            payload = decode(key, token)
-            payload_json = json.loads(payload.payload.decode('utf-8'))
-            if "exp" in payload_json:
-                exp = datetime.fromisoformat(payload_json["exp"])
-                if exp < datetime.now(timezone.utc):
-                    logger.error("Token has expired.")
-                    return None
+            key = _verification_key()
+            payload = await asyncio.to_thread(decode, key, token)
+            payload_json = orjson.loads(payload.payload)
+            if payload_json.get("exp", 0) < time.time():
+                logger.error("Token has expired.")
+                return None
+            _verified_tokens.set(token, payload_json)
             return payload_json
         except Exception:
-            logger.error(f"Token verification for {settings.auth_mode} failed!")
+            logger.error("Token verification for %s failed!", settings.auth_mode)
             return None 
\ No newline at end of file
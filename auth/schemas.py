@@ -1,6 +1,29 @@
 from pydantic import BaseModel, EmailStr, field_validator, ConfigDict
 from typing import Optional
 from datetime import datetime
+import re
+
+# A valid password passes in a single scan; the individual rules are only walked to explain a failure
+_VALID_PASSWORD = re.compile(r'(?=.*[a-z])(?=.*[A-Z])(?=.*[0-9])(?=.*[^a-zA-Z0-9]).{8,}', re.DOTALL)
+_PASSWORD_RULES = (
+    (re.compile('[a-z]'), 'Password must contain at least one lowercase letter.'),
+    (re.compile('[A-Z]'), 'Password must contain at least one uppercase letter.'),
+    (re.compile('[0-9]'), 'Password must contain at least one digit.'),
+    (re.compile('[^a-zA-Z0-9]'), 'Password must contain at least one special character (e.g., !, @, #, $).'),
+)
+
+
+def password_policy_violation(password: str) -> Optional[str]:
+    """Return the first password policy rule the password breaks, or None if it satisfies all of them"""
+    if _VALID_PASSWORD.match(password):
+        return None
+    if len(password) < 8:
+        return 'Password must be at least 8 characters long.'
+    for pattern, message in _PASSWORD_RULES:
+        if not pattern.search(password):
+            return message
+    return None
+
 
 class UserCreate(BaseModel):
     email: EmailStr
@@ -11,17 +34,9 @@ class UserCreate(BaseModel):
 
     @field_validator('password')
     def validate_password(cls, v):
-        import re
-        if len(v) < 8:
-            raise ValueError('Password must be at least 8 characters long.')
-        if not re.findall('[a-z]', v):
-            raise ValueError('Password must contain at least one lowercase letter.')
-        if not re.findall('[A-Z]', v):
-            raise ValueError('Password must contain at least one uppercase letter.')
-        if not re.findall('[0-9]', v):
-            raise ValueError('Password must contain at least one digit.')
-        if not re.findall('[^a-zA-Z0-9]', v):
-            raise ValueError('Password must contain at least one special character (e.g., !, @, #, $).')
+        violation = password_policy_violation(v)
+        if violation:
+            raise ValueError(violation)
         return v
 
 class UserRead(BaseModel):
@@ -49,15 +64,7 @@ class ResetPasswordRequest(BaseModel):
 
     @field_validator('new_password')
     def validate_password(cls, v):
-        import re
-        if len(v) < 8:
-            raise ValueError('Password must be at least 8 characters long.')
-        if not re.findall('[a-z]', v):
-            raise ValueError('Password must contain at least one lowercase letter.')
-        if not re.findall('[A-Z]', v):
-            raise ValueError('Password must contain at least one uppercase letter.')
-        if not re.findall('[0-9]', v):
-            raise ValueError('Password must contain at least one digit.')
-        if not re.findall('[^a-zA-Z0-9]', v):
-            raise ValueError('Password must contain at least one special character (e.g., !, @, #, $).')
+        violation = password_policy_violation(v)
+        if violation:
+            raise ValueError(violation)
         return v
\ No newline at end of file
@@ -1,29 +1,120 @@
-import json
+import asyncio
+import time
+from functools import wraps
 from typing import Optional
 from fastapi import Request, BackgroundTasks
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
-from datetime import timedelta, timezone
-from jose import jwt, JWTError
-from datetime import datetime
+import jwt
+import orjson
+from jwt import InvalidTokenError
 from sqlalchemy import update
-from pydantic import ValidationError
-from authlib.integrations.starlette_client import OAuth
 
 from config.settings import settings
 from auth.models import User, RefreshToken, AuthType
 from auth.schemas import UserCreate, UserRead, Token
-from auth.utils import get_password_hash, authenticate_user, send_email_verification, send_forgot_password_email
+from auth.utils import (
+    get_password_hash, authenticate_user, send_email_verification, send_forgot_password_email,
+    ACCESS_TTL, REFRESH_TTL
+)
 from auth.dao import AuthDAO
+from auth.token_cache import TokenCache, VerifiedTokenCache
 from organizations.dao import OrganizationDAO
 from utils.custom_logger import logger
 from db.redis_connection import RedisClient
-from utils.serializers import ResponseData
+from utils.serializers import ResponseData, response_dict
 from utils.exceptions import (
-    NotFoundError, ValidationError as CustomValidationError, UnauthorizedError, 
-    ConflictError, InternalServerError, DatabaseError
+    NotFoundError, UnauthorizedError, 
+    ConflictError, InternalServerError, DatabaseError, BaseAppException
 )
 
+# Seconds an unknown/revoked/expired refresh token is remembered in memory as unusable. Only negative
+# results are kept in process: a revoke on one worker cannot clear another worker's memory, so a
+# positive result is always confirmed against the shared state in Redis.
+REFRESH_TOKEN_NEGATIVE_CACHE_TTL = 30
+# Seconds a refresh token's validity may be served from Redis, which is shared by every worker.
+# A revoke writes "0" before deleting the row and positive states are only written with NX, so a
+# revocation is never overwritten and every worker sees it on its next refresh.
+REFRESH_TOKEN_SHARED_CACHE_TTL = 300
+# Seconds a decoded refresh-token payload is reused; validity is still checked on every refresh, so
+# this does not widen the revocation window
+REFRESH_TOKEN_PAYLOAD_CACHE_TTL = 120
+
+_refresh_token_states = TokenCache(maxsize=10000)
+
+
+def _refresh_token_state_key(refresh_token: str) -> str:
+    """Redis key holding whether a refresh token is usable, so raw tokens are never stored as keys"""
+    return f"refresh_token_state:{RefreshToken.hash_token(refresh_token)}"
+
+# Decoded refresh-token payloads, so repeated refreshes skip signature verification
+_decoded_refresh_tokens = VerifiedTokenCache(maxsize=1 << 16, ttl=REFRESH_TOKEN_PAYLOAD_CACHE_TTL)
+
+
+async def _openid_user_info(client, token: dict, label: str):
+    """(email, first_name, last_name) from the OpenID Connect userinfo of an authorized token"""
+    user_info = token.get('userinfo')
+    if not user_info:
+        raise UnauthorizedError(f"Failed to retrieve user information from {label}", "OAUTH_USER_INFO_ERROR")
+
+    email = user_info.get('email')
+    if not email:
+        raise UnauthorizedError(f"Email not provided by {label}", "OAUTH_EMAIL_MISSING")
+
+    return email, user_info.get('given_name', ''), user_info.get('family_name', '')
+
+
+async def _github_user_info(client, token: dict, label: str):
+    """(email, first_name, last_name) from the GitHub user API"""
+    # Fetch the profile and the email list concurrently; the list is only used when the email is not public
+    user_resp, emails_resp = await asyncio.gather(
+        client.get('user', token=token),
+        client.get('user/emails', token=token)
+    )
+    user_info = orjson.loads(user_resp.content)
+
+    email = user_info.get('email')
+    if not email:
+        emails = orjson.loads(emails_resp.content)
+        email = next(
+            (entry.get('email') for entry in emails if entry.get('primary') and entry.get('verified')), None
+        )
+    if not email:
+        raise UnauthorizedError(f"Failed to retrieve email from {label}", "GITHUB_EMAIL_ERROR")
+
+    # GitHub sends "name": null for accounts without a display name
+    name_parts = (user_info.get('name') or '').split(' ', 1)
+    first_name = name_parts[0] if name_parts else ''
+    last_name = name_parts[1] if len(name_parts) > 1 else ''
+    return email, first_name, last_name
+
+
+# provider -> (auth type, display label, error code, user info extractor)
+_OAUTH_PROVIDERS = {
+    'google': (AuthType.GOOGLE, "Google", "GOOGLE_OAUTH_ERROR", _openid_user_info),
+    'microsoft': (AuthType.MICROSOFT, "Microsoft", "MICROSOFT_OAUTH_ERROR", _openid_user_info),
+    'github': (AuthType.GITHUB, "GitHub", "GITHUB_OAUTH_ERROR", _github_user_info),
+}
+
+
+def service_errors(message: str, code: str):
+    """
+    Let application errors through unchanged and turn anything else into an InternalServerError
+    carrying ``message`` and ``code``; uncommitted work is rolled back when get_db closes the session
+    """
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except BaseAppException:
+                raise
+            except Exception as e:
+                logger.error("%s: %s", message, e)
+                raise InternalServerError(message, code)
+        return wrapper
+    return decorator
+
 
 class AuthService:
     """Facade service for authentication operations containing all business logic"""
@@ -35,508 +126,372 @@ class AuthService:
         self.redis_client = redis_client
 
     @staticmethod
+    @service_errors("Microsoft OAuth service is temporarily unavailable", "OAUTH_SETUP_ERROR")
     async def handle_microsoft_login(request: Request):
         """Handle Microsoft OAuth login with business logic"""
-        try:
-            if not settings.oauth_microsoft:
-                settings.oauth_microsoft = OAuth()
-                
-                settings.oauth_microsoft.register(
-                    name='microsoft',
-                    client_id=settings.microsoft_client_id,
-                    client_secret=settings.microsoft_client_secret,
-                    server_metadata_url='https://login.microsoftonline.com/common/v2.0/.well-known/openid-configuration',
-                    client_kwargs={
-                        'scope': 'openid email profile',
-                    }
-                )
-            
-            redirect_uri = request.url_for('microsoft_auth_callback')
-            return await settings.oauth_microsoft.microsoft.authorize_redirect(request, redirect_uri)
-        except Exception as e:
-            logger.error(f"Microsoft OAuth setup error: {str(e)}")
-            raise InternalServerError("Microsoft OAuth service is temporarily unavailable", "OAUTH_SETUP_ERROR")
+        redirect_uri = request.url_for('microsoft_auth_callback')
+        return await request.app.state.oauth.microsoft.authorize_redirect(request, redirect_uri)
 
     @staticmethod
+    @service_errors("Google OAuth service is temporarily unavailable", "OAUTH_SETUP_ERROR")
     async def handle_google_login(request: Request):
         """Handle Google OAuth login with business logic"""
-        try:
-            if not settings.oauth_google:
-                settings.oauth_google = OAuth()
-
-                settings.oauth_google.register(
-                    name='google',
-                    client_id=settings.google_client_id,
-                    client_secret=settings.google_client_secret,
-                    server_metadata_url='https://accounts.google.com/.well-known/openid-configuration',
-                    client_kwargs={
-                        'scope': 'email openid profile',
-                    }
-                )
-
-            redirect_uri = request.url_for('google_auth_callback')
-            return await settings.oauth_google.google.authorize_redirect(request, redirect_uri)
-        except Exception as e:
-            logger.error(f"Google OAuth setup error: {str(e)}")
-            raise InternalServerError("Google OAuth service is temporarily unavailable", "OAUTH_SETUP_ERROR")
+        redirect_uri = request.url_for('google_auth_callback')
+        return await request.app.state.oauth.google.authorize_redirect(request, redirect_uri)
 
     @staticmethod
+    @service_errors("GitHub OAuth service is temporarily unavailable", "OAUTH_SETUP_ERROR")
     async def handle_github_login(request: Request):
         """Handle GitHub OAuth login with business logic"""
-        try:
-            if not settings.oauth_github:
-                settings.oauth_github = OAuth()
-                settings.oauth_github.register(
-                    name='github',
-                    client_id=settings.github_client_id,
-                    client_secret=settings.github_client_secret,
-                    access_token_url='https://github.com/login/oauth/access_token',
-                    authorize_url='https://github.com/login/oauth/authorize',
-                    api_base_url='https://api.github.com/',
-                    client_kwargs={'scope': 'user:email'},
-                )
-            redirect_uri = request.url_for('github_callback')
-            return await settings.oauth_github.github.authorize_redirect(request, redirect_uri)
-        except Exception as e:
-            logger.error(f"GitHub OAuth setup error: {str(e)}")
-            raise InternalServerError("GitHub OAuth service is temporarily unavailable", "OAUTH_SETUP_ERROR")
+        redirect_uri = request.url_for('github_callback')
+        return await request.app.state.oauth.github.authorize_redirect(request, redirect_uri)
 
+    @service_errors("User registration failed", "REGISTRATION_ERROR")
     async def register_user(self, user: UserCreate, background_tasks: BackgroundTasks, code: Optional[str]):
         """Complete user registration process with business logic"""
-        try:
-            # Check if user already exists
-            existing_user = await self.auth_dao.get_user_by_email(user.email)
-            if existing_user:
-                logger.warning(f"User registration attempt with existing email: {user.email}")
-                raise ConflictError("User with this email already exists", "USER_EXISTS")
-
-            # Hash password and determine verification status
-            hashed_password = await get_password_hash(user.password)
-            verification_required = not bool(code)
-
-            # Create user data
-            user_data = {
-                "first_name": user.first_name,
-                "last_name": user.last_name,
-                "email": user.email,
-                "hashed_password": hashed_password,
-                "verified": not verification_required,
-                "phone_number": user.phone_number
-            }
+        # Hash password and determine verification status
+        hashed_password = await get_password_hash(user.password)
+        verification_required = not bool(code)
 
-            # Create user
-            db_user = await self.auth_dao.create_user(user_data)
+        # Create user data
+        user_data = {
+            "first_name": user.first_name,
+            "last_name": user.last_name,
+            "email": user.email,
+            "hashed_password": hashed_password,
+            "verified": not verification_required,
+            "phone_number": user.phone_number
+        }
+
+        # Create user; the insert itself rejects an existing email, so there is no separate lookup
+        db_user = await self.auth_dao.create_user_if_absent(user_data)
+        if db_user is None:
+            logger.warning("User registration attempt with existing email: %s", user.email)
+            raise ConflictError("User with this email already exists", "USER_EXISTS")
+        
+        if not code:
+            # Send verification email
+            background_tasks.add_task(
+                send_email_verification,
+                redis_client=self.redis_client,
+                email=db_user.email,
+                first_name=db_user.first_name,
+                title="email_verification"
+            )
+            logger.info("User %s registered successfully. Verification email sent.", db_user.email)
             
-            if not code:
-                # Send verification email
-                background_tasks.add_task(
-                    send_email_verification,
-                    redis_client=self.redis_client,
+            return ResponseData(
+                success=True,
+                message="User registered successfully. Please check your email for verification link.",
+                # The row was just built from a validated UserCreate, so skip re-validating it
+                data=UserRead.model_construct(
                     email=db_user.email,
                     first_name=db_user.first_name,
-                    title="email_verification"
+                    last_name=db_user.last_name,
+                    phone_number=db_user.phone_number
                 )
-                logger.info(f"User {db_user.email} registered successfully. Verification email sent.")
+            ).model_dump()
+        else:
+            # Handle organization invitation
+            try:
+                # Invitation codes are single-use, so consume the code in the same round trip as the read
+                redis_code_value = await self.redis_client.getdel("invitation_email:" + code)
+                if not redis_code_value:
+                    raise NotFoundError("Invalid invitation code", "INVALID_INVITATION")
+                
+                json_object = orjson.loads(redis_code_value)
+                result = await self.org_dao.add_user_to_organization(json_object["organization_id"], db_user.id, json_object["role_id"])
                 
                 return ResponseData(
                     success=True,
-                    message="User registered successfully. Please check your email for verification link.",
-                    data=UserRead.model_validate(db_user)
+                    message="User registered and added to organization successfully",
+                    data=result
                 ).model_dump()
-            else:
-                # Handle organization invitation
-                try:
-                    redis_code_value = await self.redis_client.get("invitation_email:" + code)
-                    if not redis_code_value:
-                        raise NotFoundError("Invalid invitation code", "INVALID_INVITATION")
-                    
-                    json_object = json.loads(redis_code_value)
-                    result = await self.org_dao.add_user_to_organization(json_object.organization_id, db_user.id, json_object.role_id)
-                    
-                    return ResponseData(
-                        success=True,
-                        message="User registered and added to organization successfully",
-                        data=result
-                    ).model_dump()
-                except Exception as e:
-                    logger.error(f"Organization invitation processing error: {str(e)}")
-                    raise InternalServerError("Failed to process organization invitation", "INVITATION_PROCESSING_ERROR")
-                
-        except ValidationError as e:
-            logger.error(f"Validation error during registration: {e.errors()}")
-            await self.db.rollback()
-            raise CustomValidationError(f"Validation failed: {e.errors()}", "VALIDATION_ERROR")
-        except Exception as e:
-            await self.db.rollback()
-            if not isinstance(e, (ConflictError, NotFoundError, CustomValidationError, InternalServerError)):
-                logger.error(f"Unexpected error during user registration: {str(e)}")
-                raise InternalServerError("User registration failed", "REGISTRATION_ERROR")
-            raise
+            except NotFoundError:
+                raise
+            except Exception as e:
+                logger.error("Organization invitation processing error: %s", e)
+                raise InternalServerError("Failed to process organization invitation", "INVITATION_PROCESSING_ERROR")
 
+    @service_errors("Authentication service temporarily unavailable", "TOKEN_CREATION_ERROR")
     async def authenticate_and_create_tokens(self, form_data: OAuth2PasswordRequestForm):
         """Authenticate user and create access/refresh tokens"""
-        try:
-            user = await authenticate_user(self.auth_dao.db, form_data.username, form_data.password)
-            if not user:
-                logger.warning(f"Failed login attempt for email: {form_data.username}")
-                raise UnauthorizedError("Invalid email or password", "INVALID_CREDENTIALS")
-            
-            # Create tokens
-            access_token_expires = timedelta(minutes=settings.access_token_expire_minutes)
-            access_token = await settings.auth_instance.create_access_token(
-                data={"sub": form_data.username}, expires_delta=access_token_expires
-            )
-            refresh_token_expires = timedelta(days=settings.refresh_token_expire_days)
-            refresh_token = await settings.auth_instance.create_refresh_token(
-                data={"sub": form_data.username}, expires_delta=refresh_token_expires, db=self.auth_dao.db
-            )
-            
-            logger.info(f"User {form_data.username} logged in successfully.")
-            
-            return ResponseData(
-                success=True,
-                message="Login successful",
-                data={
-                    "access_token": access_token, 
-                    "refresh_token": refresh_token, 
-                    "token_type": "bearer"
-                }
-            ).model_dump()
-            
-        except UnauthorizedError:
-            await self.db.rollback()
-            raise
-        except Exception as e:
-            await self.db.rollback()
-            logger.error(f"Token creation error: {str(e)}")
-            raise InternalServerError("Authentication service temporarily unavailable", "TOKEN_CREATION_ERROR")
+        user = await authenticate_user(self.auth_dao.db, form_data.username, form_data.password)
+        if not user:
+            logger.warning("Failed login attempt for email: %s", form_data.username)
+            raise UnauthorizedError("Invalid email or password", "INVALID_CREDENTIALS")
+        
+        # Create tokens
+        access_token, refresh_token = await settings.auth_instance.create_token_pair(
+            data={"sub": form_data.username},
+            access_expires_delta=ACCESS_TTL,
+            refresh_expires_delta=REFRESH_TTL,
+            db=self.auth_dao.db
+        )
+        await self.db.commit()
+        
+        logger.info("User %s logged in successfully.", form_data.username)
+        
+        return response_dict(
+            success=True,
+            message="Login successful",
+            data={
+                "access_token": access_token, 
+                "refresh_token": refresh_token, 
+                "token_type": "bearer"
+            }
+        )
 
+    @service_errors("Token refresh failed", "TOKEN_REFRESH_ERROR")
     async def refresh_user_token(self, refresh_token: str):
         """Refresh user access token using refresh token"""
         try:
-            payload = jwt.decode(refresh_token, settings.secret_key, algorithms=[settings.algorithm])
+            payload = _decoded_refresh_tokens.get(refresh_token)
+            if payload is None:
+                payload = await asyncio.to_thread(
+                    jwt.decode, refresh_token, settings.secret_key, algorithms=[settings.algorithm],
+                    options={"require": ["exp", "sub"]}
+                )
+                _decoded_refresh_tokens.set(refresh_token, payload)
             username: str = payload.get("sub")
             if username is None:
                 logger.warning("Token refresh attempt with invalid payload")
                 raise UnauthorizedError("Invalid token payload", "INVALID_TOKEN_PAYLOAD")
-        except JWTError:
+        except InvalidTokenError:
             logger.warning("Token refresh attempt with invalid JWT")
             raise UnauthorizedError("Invalid or expired token", "INVALID_JWT")
 
-        # Validate refresh token
-        db_refresh_token = await self.auth_dao.get_refresh_token(refresh_token)
-        if not db_refresh_token or db_refresh_token.expires_at < datetime.now(timezone.utc):
-            logger.warning(f"Token refresh attempt with expired token for user: {username}")
+        # Validate refresh token; a token this worker already found unusable skips Redis and the database
+        if _refresh_token_states.get(refresh_token) is False:
+            is_valid = False
+        else:
+            is_valid = await self._load_refresh_token_state(refresh_token, payload)
+        if not is_valid:
+            logger.warning("Token refresh attempt with expired token for user: %s", username)
             raise UnauthorizedError("Refresh token has expired", "EXPIRED_TOKEN")
 
-        try:
-            # Generate new access token
-            access_token_expires = timedelta(minutes=settings.access_token_expire_minutes)
-            access_token = await settings.auth_instance.create_access_token(
-                data={"sub": username}, expires_delta=access_token_expires
-            )
+        # Generate new access token
+        access_token = await settings.auth_instance.create_access_token(
+            data={"sub": username}, expires_delta=ACCESS_TTL
+        )
 
-            logger.info(f"Access token refreshed for user {username}.")
-            
-            return ResponseData(
-                success=True,
-                message="Token refreshed successfully",
-                data={
-                    "access_token": access_token, 
-                    "refresh_token": refresh_token, 
-                    "token_type": "bearer"
-                }
-            ).model_dump()
-            
-        except Exception as e:
-            await self.db.rollback()
-            logger.error(f"Token refresh error: {str(e)}")
-            raise InternalServerError("Token refresh failed", "TOKEN_REFRESH_ERROR")
+        logger.info("Access token refreshed for user %s.", username)
+        
+        return response_dict(
+            success=True,
+            message="Token refreshed successfully",
+            data={
+                "access_token": access_token, 
+                "refresh_token": refresh_token, 
+                "token_type": "bearer"
+            }
+        )
 
-    async def revoke_user_token(self, refresh_token: str):
-        """Revoke user refresh token"""
+    async def _load_refresh_token_state(self, refresh_token: str, payload: dict) -> bool:
+        """
+        Check whether a refresh token is usable, first in Redis and then in the database,
+        caching the answer in Redis (and a negative answer in memory)
+        """
+        state_key = _refresh_token_state_key(refresh_token)
         try:
-            success = await self.auth_dao.delete_refresh_token(refresh_token)
-            if success:
-                logger.info("Refresh token revoked successfully.")
-                return ResponseData(
-                    success=True,
-                    message="Token revoked successfully"
-                ).model_dump()
-            else:
-                logger.warning("Token revocation attempt with non-existent token")
-                raise NotFoundError("Token not found", "TOKEN_NOT_FOUND")
-        except NotFoundError:
-            await self.db.rollback()
-            raise
+            cached = await self.redis_client.redis.get(state_key)
         except Exception as e:
-            await self.db.rollback()
-            logger.error(f"Token revocation error: {str(e)}")
-            raise InternalServerError("Token revocation failed", "TOKEN_REVOCATION_ERROR")
+            logger.error("Refresh token state lookup failed: %s", e)
+            cached = None
 
-    async def handle_google_callback(self, request: Request):
-        """Handle Google OAuth callback with user creation/authentication logic"""
-        try:
-            token = await settings.oauth_google.google.authorize_access_token(request)
-            user_info = token.get('userinfo')
-            
-            if not user_info:
-                raise UnauthorizedError("Failed to retrieve user information from Google", "OAUTH_USER_INFO_ERROR")
+        now = time.time()
+        exp = payload.get("exp")
+        if cached is not None:
+            is_valid = cached == "1"
+        else:
+            is_valid = await self.auth_dao.is_refresh_token_active(refresh_token)
+            # The row's expiry matches the token's exp claim, so a positive result never outlives either
+            ttl = REFRESH_TOKEN_SHARED_CACHE_TTL if is_valid else REFRESH_TOKEN_NEGATIVE_CACHE_TTL
+            if is_valid and exp is not None:
+                ttl = min(ttl, int(exp - now))
+            if ttl > 0:
+                try:
+                    # A positive result is written with NX so that, if a revoke landed between our
+                    # database read and this write, its "0" is never overwritten
+                    stored = await self.redis_client.redis.set(
+                        state_key, "1" if is_valid else "0", ex=ttl, nx=is_valid
+                    )
+                    if is_valid and not stored:
+                        is_valid = await self.redis_client.redis.get(state_key) == "1"
+                except Exception as e:
+                    logger.error("Refresh token state write failed: %s", e)
 
-            email = user_info.get('email')
-            if not email:
-                raise UnauthorizedError("Email not provided by Google", "OAUTH_EMAIL_MISSING")
-                
-            first_name = user_info.get('given_name', '')
-            last_name = user_info.get('family_name', '')
-            
-            # Get or create user
-            user_in_db = await self.auth_dao.get_user_by_email(email)
-            if not user_in_db:
-                user_data = {
-                    "email": email,
-                    "first_name": first_name,
-                    "last_name": last_name,
-                    "verified": True,
-                    "auth_type": AuthType.GOOGLE
-                }
-                user_in_db = await self.auth_dao.create_user(user_data)
-                logger.info(f"New user created via Google OAuth: {email}")
-            
-            # Generate tokens
-            tokens = await self._create_oauth_tokens(email)
-            
+        if not is_valid:
+            _refresh_token_states.set(refresh_token, False, now + REFRESH_TOKEN_NEGATIVE_CACHE_TTL)
+        return is_valid
+
+    @service_errors("Token revocation failed", "TOKEN_REVOCATION_ERROR")
+    async def revoke_user_token(self, refresh_token: str):
+        """Revoke user refresh token"""
+        # Mark the token revoked in Redis before deleting the row: this overwrites any cached "1", and a
+        # refresh that already read the active row cannot replace it (positive states use NX). If Redis
+        # is unreachable the revoke fails instead of leaving a stale "1" behind.
+        await self.redis_client.redis.set(
+            _refresh_token_state_key(refresh_token), "0", ex=REFRESH_TOKEN_SHARED_CACHE_TTL
+        )
+        success = await self.auth_dao.delete_refresh_token(refresh_token)
+        _refresh_token_states.invalidate(refresh_token)
+        _decoded_refresh_tokens.invalidate(refresh_token)
+        if success:
+            logger.info("Refresh token revoked successfully.")
             return ResponseData(
                 success=True,
-                message="Google authentication successful",
-                data=tokens
+                message="Token revoked successfully"
             ).model_dump()
-            
-        except (UnauthorizedError, InternalServerError):
-            await self.db.rollback()
-            raise
-        except Exception as e:
-            await self.db.rollback()
-            logger.error(f"Google OAuth callback error: {str(e)}")
-            raise InternalServerError("Google authentication failed", "GOOGLE_OAUTH_ERROR")
+        else:
+            logger.warning("Token revocation attempt with non-existent token")
+            raise NotFoundError("Token not found", "TOKEN_NOT_FOUND")
 
-    async def handle_microsoft_callback(self, request: Request):
-        """Handle Microsoft OAuth callback with user creation/authentication logic"""
+    async def _handle_oauth_callback(self, request: Request, provider: str):
+        """Shared OAuth callback: exchange the code, extract the profile, then sign the user in"""
+        auth_type, label, error_code, extract_user_info = _OAUTH_PROVIDERS[provider]
         try:
-            token = await settings.oauth_microsoft.microsoft.authorize_access_token(request)
-            user_info = token.get('userinfo')
-            
-            if not user_info:
-                raise UnauthorizedError("Failed to retrieve user information from Microsoft", "OAUTH_USER_INFO_ERROR")
+            client = getattr(request.app.state.oauth, provider)
+            token = await client.authorize_access_token(request)
+            email, first_name, last_name = await extract_user_info(client, token, label)
+
+            return await self._complete_oauth_login(email, first_name, last_name, auth_type, label)
 
-            email = user_info.get('email')
-            if not email:
-                raise UnauthorizedError("Email not provided by Microsoft", "OAUTH_EMAIL_MISSING")
-                
-            first_name = user_info.get('given_name', '')
-            last_name = user_info.get('family_name', '')
-            
-            # Get or create user
-            user_in_db = await self.auth_dao.get_user_by_email(email)
-            if not user_in_db:
-                user_data = {
-                    "email": email,
-                    "first_name": first_name,
-                    "last_name": last_name,
-                    "verified": True,
-                    "auth_type": AuthType.MICROSOFT
-                }
-                user_in_db = await self.auth_dao.create_user(user_data)
-                logger.info(f"New user created via Microsoft OAuth: {email}")
-            
-            # Generate tokens
-            tokens = await self._create_oauth_tokens(email)
-            
-            return ResponseData(
-                success=True,
-                message="Microsoft authentication successful",
-                data=tokens
-            ).model_dump()
-            
         except (UnauthorizedError, InternalServerError):
-            await self.db.rollback()
             raise
         except Exception as e:
-            await self.db.rollback()
-            logger.error(f"Microsoft OAuth callback error: {str(e)}")
-            raise InternalServerError("Microsoft authentication failed", "MICROSOFT_OAUTH_ERROR")
+            logger.error("%s OAuth callback error: %s", label, e)
+            raise InternalServerError(f"{label} authentication failed", error_code)
+
+    async def handle_google_callback(self, request: Request):
+        """Handle Google OAuth callback with user creation/authentication logic"""
+        return await self._handle_oauth_callback(request, 'google')
+
+    async def handle_microsoft_callback(self, request: Request):
+        """Handle Microsoft OAuth callback with user creation/authentication logic"""
+        return await self._handle_oauth_callback(request, 'microsoft')
 
     async def handle_github_callback(self, request: Request):
         """Handle GitHub OAuth callback with user creation/authentication logic"""
-        try:
-            token = await settings.oauth_github.github.authorize_access_token(request)
-            
-            # Get user info from GitHub API
-            resp = await settings.oauth_github.github.get('user', token=token)
-            user_info = resp.json()
-            
-            # Get user email if not public
-            if not user_info.get('email'):
-                resp = await settings.oauth_github.github.get('user/emails', token=token)
-                emails = resp.json()
-                primary_email = next((email['email'] for email in emails if email['primary']), None)
-                user_info['email'] = primary_email
-            
-            if not user_info or not user_info.get('email'):
-                raise UnauthorizedError("Failed to retrieve email from GitHub", "GITHUB_EMAIL_ERROR")
-
-            email = user_info['email']
-            name_parts = (user_info.get('name', '')).split(' ', 1)
-            first_name = name_parts[0] if name_parts else ''
-            last_name = name_parts[1] if len(name_parts) > 1 else ''
-            
-            # Get or create user
-            user_in_db = await self.auth_dao.get_user_by_email(email)
-            if not user_in_db:
-                user_data = {
-                    "email": email,
-                    "first_name": first_name,
-                    "last_name": last_name,
-                    "verified": True,
-                    "auth_type": AuthType.GITHUB
-                }
-                user_in_db = await self.auth_dao.create_user(user_data)
-                logger.info(f"New user created via GitHub OAuth: {email}")
-            
-            # Generate tokens
-            tokens = await self._create_oauth_tokens(email)
-            
-            return ResponseData(
-                success=True,
-                message="GitHub authentication successful",
-                data=tokens
-            ).model_dump()
-            
-        except (UnauthorizedError, InternalServerError):
-            raise
-        except Exception as e:
-            logger.error(f"GitHub OAuth callback error: {str(e)}")
-            raise InternalServerError("GitHub authentication failed", "GITHUB_OAUTH_ERROR")
+        return await self._handle_oauth_callback(request, 'github')
 
+    @service_errors("Email verification failed", "EMAIL_VERIFICATION_ERROR")
     async def verify_user_email(self, code: str):
         """Verify user email with business logic"""
-        try:
-            redis_code_value = await self.redis_client.get("email_verification:" + code)
-            if not redis_code_value:
-                logger.warning(f"Email verification attempt with invalid code: {code}")
-                raise UnauthorizedError("Invalid or expired verification code", "INVALID_VERIFICATION_CODE")
-            
-            json_object = json.loads(redis_code_value)
-            email = json_object.get("email")
-            
-            if not email:
-                raise InternalServerError("Invalid verification data", "VERIFICATION_DATA_ERROR")
-            
-            # Update user verification status
-            success = await self.auth_dao.update_user_verification_status(email, True)
-            if not success:
-                raise NotFoundError("User not found", "USER_NOT_FOUND")
-            
-            # Delete the verification code from Redis
-            await self.redis_client.delete("email_verification:" + code)
-            
-            logger.info(f"Email {email} verified successfully.")
-            
-            return ResponseData(
-                success=True,
-                message="Email verified successfully"
-            ).model_dump()
-            
-        except (UnauthorizedError, NotFoundError, InternalServerError):
-            raise
-        except Exception as e:
-            logger.error(f"Email verification error: {str(e)}")
-            raise InternalServerError("Email verification failed", "EMAIL_VERIFICATION_ERROR")
+        # The code is single-use, so consume it in the same round trip as the read
+        redis_code_value = await self.redis_client.getdel("email_verification:" + code)
+        if not redis_code_value:
+            logger.warning("Email verification attempt with invalid code: %s", code)
+            raise UnauthorizedError("Invalid or expired verification code", "INVALID_VERIFICATION_CODE")
+        
+        json_object = orjson.loads(redis_code_value)
+        email = json_object.get("email")
+        
+        if not email:
+            raise InternalServerError("Invalid verification data", "VERIFICATION_DATA_ERROR")
+        
+        # Update user verification status
+        success = await self.auth_dao.update_user_verification_status(email, True)
+        if not success:
+            raise NotFoundError("User not found", "USER_NOT_FOUND")
+        
+        logger.info("Email %s verified successfully.", email)
+        
+        return ResponseData(
+            success=True,
+            message="Email verified successfully"
+        ).model_dump()
 
-    async def initiate_password_reset(self, user_id: int, background_tasks: BackgroundTasks):
+    @service_errors("Failed to initiate password reset", "PASSWORD_RESET_INITIATION_ERROR")
+    async def initiate_password_reset(self, email: str, background_tasks: BackgroundTasks):
         """Initiate password reset process"""
-        try:
-            user = await self.auth_dao.get_user_by_id(user_id)
-            if not user:
-                logger.warning(f"Password reset attempt for non-existent email: {user_id}")
-                raise NotFoundError("User with this email does not exist", "USER_NOT_FOUND")
-            
-            background_tasks.add_task(
-                send_forgot_password_email,
-                redis_client=self.redis_client,
-                email=user.email,
-                first_name=user.first_name,
-                title="forgot_password"
-            )
-            
-            logger.info(f"Password reset email sent to {user_id}.")
-            
-            return ResponseData(
-                success=True,
-                message="Password reset email sent successfully"
-            ).model_dump()
-            
-        except NotFoundError:
-            raise
-        except Exception as e:
-            logger.error(f"Password reset initiation error: {str(e)}")
-            raise InternalServerError("Failed to initiate password reset", "PASSWORD_RESET_INITIATION_ERROR")
+        user = await self.auth_dao.get_reset_contact_by_email(email)
+        if not user:
+            logger.warning("Password reset attempt for non-existent email: %s", email)
+            raise NotFoundError("User with this email does not exist", "USER_NOT_FOUND")
+        
+        background_tasks.add_task(
+            send_forgot_password_email,
+            redis_client=self.redis_client,
+            email=user.email,
+            first_name=user.first_name,
+            title="forgot_password"
+        )
+        
+        logger.info("Password reset email sent to %s.", email)
+        
+        return ResponseData(
+            success=True,
+            message="Password reset email sent successfully"
+        ).model_dump()
 
+    @service_errors("Password reset failed", "PASSWORD_RESET_ERROR")
     async def reset_user_password(self, code: str, new_password: str):
         """Reset user password with business logic"""
-        try:
-            redis_code_value = await self.redis_client.get("forgot_password:" + code)
-            if not redis_code_value:
-                logger.warning(f"Password reset attempt with invalid code: {code}")
-                raise UnauthorizedError("Invalid or expired reset code", "INVALID_RESET_CODE")
-            
-            json_object = json.loads(redis_code_value)
-            email = json_object.get("email")
-            
-            if not email:
-                raise InternalServerError("Invalid reset data", "RESET_DATA_ERROR")
-            
-            # Hash the new password
-            hashed_password = await get_password_hash(new_password)
-            
-            # Update user password
-            success = await self.auth_dao.update_user_password(email, hashed_password)
-            if not success:
-                raise NotFoundError("User not found", "USER_NOT_FOUND")
-            
-            # Delete the reset code from Redis
-            await self.redis_client.delete("forgot_password:" + code)
-            
-            logger.info(f"Password reset successfully for {email}.")
-            
-            return ResponseData(
-                success=True,
-                message="Password reset successfully"
-            ).model_dump()
-            
-        except (UnauthorizedError, NotFoundError, InternalServerError):
-            raise
-        except Exception as e:
-            logger.error(f"Password reset error: {str(e)}")
-            raise InternalServerError("Password reset failed", "PASSWORD_RESET_ERROR")
+        # The code is single-use, so consume it in the same round trip as the read
+        redis_code_value = await self.redis_client.getdel("forgot_password:" + code)
+        if not redis_code_value:
+            logger.warning("Password reset attempt with invalid code: %s", code)
+            raise UnauthorizedError("Invalid or expired reset code", "INVALID_RESET_CODE")
+        
+        json_object = orjson.loads(redis_code_value)
+        email = json_object.get("email")
+        
+        if not email:
+            raise InternalServerError("Invalid reset data", "RESET_DATA_ERROR")
+        
+        # Hash the new password
+        hashed_password = await get_password_hash(new_password)
+        
+        # Update user password
+        success = await self.auth_dao.update_user_password(email, hashed_password)
+        if not success:
+            raise NotFoundError("User not found", "USER_NOT_FOUND")
+        
+        logger.info("Password reset successfully for %s.", email)
+        
+        return ResponseData(
+            success=True,
+            message="Password reset successfully"
+        ).model_dump()
+
+    async def _complete_oauth_login(
+        self, email: str, first_name: str, last_name: str, auth_type: AuthType, provider: str
+    ):
+        """Create the OAuth user if needed and issue tokens; shared by every provider callback"""
+        # Create the user unless one already exists; only the email is needed afterwards.
+        # The insert is committed together with the refresh token in _create_oauth_tokens.
+        user_data = {
+            "email": email,
+            "first_name": first_name,
+            "last_name": last_name,
+            "verified": True,
+            "auth_type": auth_type
+        }
+        if await self.auth_dao.create_user_if_absent(user_data, commit=False):
+            logger.info("New user created via %s OAuth: %s", provider, email)
 
+        tokens = await self._create_oauth_tokens(email)
+
+        return response_dict(
+            success=True,
+            message=f"{provider} authentication successful",
+            data=tokens
+        )
+
+    @service_errors("Failed to create authentication tokens", "OAUTH_TOKEN_ERROR")
     async def _create_oauth_tokens(self, email: str):
         """Helper method to create OAuth tokens"""
-        try:
-            access_token_expires = timedelta(minutes=settings.access_token_expire_minutes)
-            access_token = await settings.auth_instance.create_access_token(
-                data={"sub": email}, expires_delta=access_token_expires
-            )
-            refresh_token_expires = timedelta(days=settings.refresh_token_expire_days)
-            refresh_token = await settings.auth_instance.create_refresh_token(
-                data={"sub": email}, expires_delta=refresh_token_expires, db=self.auth_dao.db
-            )
-            
-            return {
-                "access_token": access_token, 
-                "refresh_token": refresh_token, 
-                "token_type": "bearer"
-            }
-        except Exception as e:
-            logger.error(f"OAuth token creation error: {str(e)}")
-            raise InternalServerError("Failed to create authentication tokens", "OAUTH_TOKEN_ERROR") 
\ No newline at end of file
+        access_token, refresh_token = await settings.auth_instance.create_token_pair(
+            data={"sub": email},
+            access_expires_delta=ACCESS_TTL,
+            refresh_expires_delta=REFRESH_TTL,
+            db=self.auth_dao.db
+        )
+        await self.db.commit()
+        
+        return {
+            "access_token": access_token, 
+            "refresh_token": refresh_token, 
+            "token_type": "bearer"
+        }
\ No newline at end of file
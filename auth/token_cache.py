@@ -0,0 +1,67 @@
+import hashlib
+import time
+from typing import Any, Dict, Optional, Tuple
+
+
+class TokenCache:
+    """
+    Bounded in-process cache keyed by a SHA-256 of the token, so raw tokens are never held as keys.
+
+    Every entry carries its own expiry (epoch seconds). When full, the oldest entry is evicted.
+    """
+
+    def __init__(self, maxsize: int = 10000):
+        self.maxsize = maxsize
+        self._entries: Dict[bytes, Tuple[float, Any]] = {}
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> Optional[Any]:
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.time():
+            self._entries.pop(key, None)
+            return None
+        return value
+
+    def set(self, token: str, value: Any, expires_at: float) -> None:
+        if expires_at <= time.time():
+            return
+        if len(self._entries) >= self.maxsize:
+            self._entries.pop(next(iter(self._entries)), None)
+        self._entries[self._key(token)] = (expires_at, value)
+
+    def invalidate(self, token: str) -> None:
+        self._entries.pop(self._key(token), None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class VerifiedTokenCache(TokenCache):
+    """
+    Short-lived cache of verified token payloads.
+
+    An entry lives for at most ``ttl`` seconds and never past the token's own ``exp``, so a hit
+    can be returned without re-checking the signature.
+    """
+
+    def __init__(self, maxsize: int = 10000, ttl: int = 30):
+        super().__init__(maxsize)
+        self.ttl = ttl
+
+    def get(self, token: str) -> Optional[dict]:
+        payload = super().get(token)
+        return dict(payload) if payload is not None else None
+
+    def set(self, token: str, payload: dict) -> None:
+        expires_at = time.time() + self.ttl
+        exp = payload.get("exp")
+        if exp is not None:
+            expires_at = min(expires_at, exp)
+        super().set(token, dict(payload), expires_at)
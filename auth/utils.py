@@ -1,34 +1,114 @@
 # import aiofiles
-import uuid
+import asyncio
+import hashlib
+import hmac
+import os
+import secrets
+import time
+import orjson
 from passlib.context import CryptContext
-from sqlalchemy.future import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from config.settings import settings
 from utils.custom_logger import logger
-from auth.models import User
+from auth.dao import AuthDAO
+from auth.schemas import password_policy_violation
+from auth.token_cache import TokenCache
+from db.pg_connection import SessionLocal
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 from urllib.parse import urljoin, urlencode
 from utils.email_provider import send_mail
 from html_templates.email_verification_template import email_verification_template
 from html_templates.forgot_pass_template import reset_password_template
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# New hashes use Argon2id. bcrypt stays listed (and deprecated) so existing hashes still verify and
+# are rehashed by authenticate_user on the next successful login.
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__type="id",
+    argon2__memory_cost=settings.argon2_memory_kib,
+    argon2__time_cost=settings.argon2_time_cost,
+    argon2__parallelism=settings.argon2_parallelism,
+)
+
+# argon2 and bcrypt both release the GIL while hashing, so threads already spread it across cores. A
+# dedicated pool sized to the CPU count keeps login/registration bursts from starving the default
+# executor that token signing runs on.
+_password_hash_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="password-hash")
+
+# Token lifetimes are fixed for the life of the process, so build them once
+ACCESS_TTL = timedelta(minutes=settings.access_token_expire_minutes)
+REFRESH_TTL = timedelta(days=settings.refresh_token_expire_days)
+# How long email verification and password reset links stay valid
+EMAIL_LINK_TTL = timedelta(hours=3)
+
+# Seconds between sweeps of expired/revoked refresh tokens
+REFRESH_TOKEN_PURGE_INTERVAL = 15 * 60
+
+# Successful password checks are remembered briefly so repeat logins skip hashing. The key is an HMAC
+# over the email, password and stored hash, so a password change simply stops matching.
+PASSWORD_CHECK_CACHE_TTL = 300
+_verified_passwords = TokenCache(maxsize=4096)
 
 
 async def verify_password(plain_password, hashed_password):
-    return pwd_context.verify(plain_password, hashed_password)
+    # Password hashing is deliberately slow; run it off the event loop so other requests keep being served
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_hash_pool, pwd_context.verify, plain_password, hashed_password)
 
 async def get_password_hash(password):
-    return pwd_context.hash(password)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_hash_pool, pwd_context.hash, password)
+
+def _password_check_key(email: str, password: str, hashed_password: str) -> str:
+    message = f"{email}\0{password}\0{hashed_password}".encode()
+    return hmac.new(settings.secret_key.encode(), message, hashlib.sha256).hexdigest()
 
 async def authenticate_user(db: AsyncSession, email: str, password: str):
-    user = await db.execute(select(User).where(User.email == email))
-    user = user.scalars().first()
-    if not user or not await verify_password(password, user.hashed_password):
+    # Registration and password reset enforce the password policy, so a password that breaks it
+    # (which covers the common ones like "123456" or "password") cannot match any account.
+    # Rejecting it here keeps credential-stuffing lists from costing a lookup and a hash check.
+    if password_policy_violation(password):
+        return False
+
+    user = await AuthDAO(db).get_auth_row_by_email(email)
+    if not user:
+        return False
+
+    check_key = _password_check_key(email, password, user.hashed_password)
+    if _verified_passwords.get(check_key):
+        return user
+    if not await verify_password(password, user.hashed_password):
         return False
+    if pwd_context.needs_update(user.hashed_password):
+        # Legacy bcrypt hash, or Argon2 parameters changed since it was made; the plaintext is only
+        # available now, so upgrade it while we have it
+        try:
+            await AuthDAO(db).update_user_password(email, await get_password_hash(password))
+        except Exception as e:
+            logger.error("Password rehash failed for %s: %s", email, e)
+    else:
+        _verified_passwords.set(check_key, True, time.time() + PASSWORD_CHECK_CACHE_TTL)
     return user
 
 
+async def purge_refresh_tokens_periodically(interval: int = REFRESH_TOKEN_PURGE_INTERVAL):
+    """
+    Delete expired and revoked refresh tokens every `interval` seconds until cancelled,
+    keeping the refresh_tokens table and its indexes small.
+    """
+    while True:
+        try:
+            async with SessionLocal() as db:
+                deleted = await AuthDAO(db).delete_expired_refresh_tokens()
+            if deleted:
+                logger.info("Purged %s expired or revoked refresh tokens.", deleted)
+        except Exception as e:
+            logger.error("Refresh token purge failed: %s", e)
+        await asyncio.sleep(interval)
+
+
 async def send_email_verification(redis_client, email, first_name, title):
     """
     Sends an email verification link to the specified email.
@@ -43,10 +123,10 @@ async def send_email_verification(redis_client, email, first_name, title):
     """
     try:
         # Generate a unique verification token
-        verification_token = uuid.uuid4()
+        verification_token = secrets.token_urlsafe(16)
         token_key = f"{title}:{verification_token}"
 
-        await redis_client.set(token_key, email, expire=timedelta(hours=3))
+        await redis_client.set(token_key, orjson.dumps({"email": email}).decode(), expire=EMAIL_LINK_TTL)
 
         verification_url = urljoin(
             settings.hinata_host,
@@ -69,7 +149,7 @@ async def send_email_verification(redis_client, email, first_name, title):
 
         logger.info("Verification email sent successfully.")
     except Exception as e:
-        logger.error(f"Failed to send verification email: {e}")
+        logger.error("Failed to send verification email: %s", e)
         raise e
 
 async def send_forgot_password_email(redis_client, email, first_name, title):
@@ -87,10 +167,10 @@ async def send_forgot_password_email(redis_client, email, first_name, title):
     """
     try:
         # Generate a unique verification token
-        verification_token = uuid.uuid4()
+        verification_token = secrets.token_urlsafe(16)
         token_key = f"{title}:{verification_token}"
 
-        await redis_client.set(token_key, email, expire=timedelta(hours=3))
+        await redis_client.set(token_key, orjson.dumps({"email": email}).decode(), expire=EMAIL_LINK_TTL)
 
         verification_url = urljoin(
             settings.hinata_host,
@@ -113,5 +193,5 @@ async def send_forgot_password_email(redis_client, email, first_name, title):
 
         logger.info("Verification email sent successfully.")
     except Exception as e:
-        logger.error(f"Failed to send verification email: {e}")
+        logger.error("Failed to send verification email: %s", e)
         raise e
\ No newline at end of file
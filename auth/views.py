@@ -1,4 +1,5 @@
 from fastapi import Depends, BackgroundTasks, Request
+from fastapi.responses import ORJSONResponse
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
@@ -30,13 +31,15 @@ async def register_user(
     return result
 
 
+# Token-issuing views return their already-built dict as a response directly, so FastAPI skips
+# running jsonable_encoder over it before serialization
 async def login_user(
     form_data: OAuth2PasswordRequestForm = Depends(),
     auth_service: AuthService = Depends(get_auth_service)
 ):
     """Authenticate user and return tokens"""
     result = await auth_service.authenticate_and_create_tokens(form_data)
-    return result
+    return ORJSONResponse(result)
 
 
 async def refresh_token(
@@ -45,7 +48,7 @@ async def refresh_token(
 ):
     """Refresh access token"""
     result = await auth_service.refresh_user_token(refresh_token)
-    return result
+    return ORJSONResponse(result)
 
 
 async def revoke_token(
@@ -100,7 +103,7 @@ async def microsoft_callback(
 ):
     """Handle Microsoft OAuth callback"""
     result = await auth_service.handle_microsoft_callback(request)
-    return result
+    return ORJSONResponse(result)
 
 
 async def google_login(
@@ -117,7 +120,7 @@ async def google_callback(
 ):
     """Handle Google OAuth callback"""
     result = await auth_service.handle_google_callback(request)
-    return result
+    return ORJSONResponse(result)
 
 
 async def github_login(
@@ -134,4 +137,4 @@ async def github_callback(
 ):
     """Handle GitHub OAuth callback"""
     result = await auth_service.handle_github_callback(request)
-    return result
+    return ORJSONResponse(result)
@@ -1,9 +1,8 @@
 from pydantic_settings import BaseSettings
 from functools import lru_cache
-from typing import Optional, Dict
+from typing import Optional, Dict, List
 from utils.base_auth import BaseAuth
 
-from authlib.integrations.starlette_client import OAuth
 from db.redis_connection import RedisClient
 
 
@@ -11,7 +10,7 @@ class Settings(BaseSettings):
     access_token_expire_minutes: int
     refresh_token_expire_days: int
     secret_key: str
-    algorithm: str
+    algorithm: str = "HS256"
     database_url: str
     auth_mode: str
     paseto_private_key: Optional[str] = None
@@ -23,15 +22,18 @@ class Settings(BaseSettings):
     microsoft_client_secret: Optional[str] = None
     github_client_id: Optional[str] = None
     github_client_secret: Optional[str] = None
-    
-    oauth_google: Optional[OAuth] = None
-    oauth_microsoft: Optional[OAuth] = None
-    oauth_github: Optional[OAuth] = None
     redis_database_url: Optional[str] = None
     hinata_host: str = None
+    cors_origins: List[str] = ["http://localhost:3000"]
+    cors_methods: List[str] = ["*"]
+    cors_headers: List[str] = ["*"]
     email_provider: str = "netcore"
     smtp_from_email: str = "no-reply@gofynd.com"
     smtp_netcore: Optional[str] = None
+    # Argon2id cost parameters for password hashes; existing hashes are upgraded on the next login
+    argon2_memory_kib: int = 19456
+    argon2_time_cost: int = 2
+    argon2_parallelism: int = 1
     
     roles: Optional[Dict] = None
     
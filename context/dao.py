@@ -4,6 +4,7 @@ from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
 
 from auth.models import User
+from auth.dao import AuthDAO
 from organizations.models import OrganizationUser
 from teams.models import TeamMember, Team
 from roles.models import Role
@@ -18,23 +19,19 @@ class ContextDAO:
         self.db = db
 
     async def get_user_by_email(self, email: str) -> Optional[User]:
-        """Get user by email"""
+        """Get user by email, sharing the auth DAO's prebuilt statement and per-session user cache"""
         try:
-            query = select(User).where(User.email == email)
-            result = await self.db.execute(query)
-            return result.scalars().first()
-        except Exception as e:
-            logger.error(f"Error getting user by email {email}: {str(e)}")
+            return await AuthDAO(self.db).get_user_by_email(email)
+        except Exception:
+            # AuthDAO has already logged the failure; context lookups treat it as "no user"
             return None
 
     async def get_user_by_id(self, user_id: int) -> Optional[User]:
         """Get user by ID"""
         try:
-            query = select(User).where(User.id == user_id)
-            result = await self.db.execute(query)
-            return result.scalars().first()
+            return await self.db.get(User, user_id)
         except Exception as e:
-            logger.error(f"Error getting user by id {user_id}: {str(e)}")
+            logger.error("Error getting user by id %s: %s", user_id, e)
             return None
 
     async def get_organization_context(self, user_id: int, organization_id: int) -> Optional[Dict[str, Any]]:
@@ -66,7 +63,7 @@ class ContextDAO:
             }
             
         except Exception as e:
-            logger.error(f"Error getting organization context: {str(e)}")
+            logger.error("Error getting organization context: %s", e)
             return None
 
     async def get_team_context(self, user_email: str, team_id: int) -> Optional[Dict[str, Any]]:
@@ -104,7 +101,7 @@ class ContextDAO:
             }
             
         except Exception as e:
-            logger.error(f"Error getting team context: {str(e)}")
+            logger.error("Error getting team context: %s", e)
             return None
 
     async def get_team_by_id(self, team_id: int) -> Optional[Team]:
@@ -114,7 +111,7 @@ class ContextDAO:
             result = await self.db.execute(query)
             return result.scalars().first()
         except Exception as e:
-            logger.error(f"Error getting team by id {team_id}: {str(e)}")
+            logger.error("Error getting team by id %s: %s", team_id, e)
             return None
 
     async def get_organization_permissions(self, user_id: int, organization_id: int) -> List[str]:
@@ -134,7 +131,7 @@ class ContextDAO:
             return await self.get_role_permissions(org_user.role.id)
             
         except Exception as e:
-            logger.error(f"Error getting organization permissions: {str(e)}")
+            logger.error("Error getting organization permissions: %s", e)
             return []
 
     async def get_team_permissions(self, user_email: str, team_id: int) -> List[str]:
@@ -159,7 +156,7 @@ class ContextDAO:
             return await self.get_role_permissions(team_member.role.id)
             
         except Exception as e:
-            logger.error(f"Error getting team permissions: {str(e)}")
+            logger.error("Error getting team permissions: %s", e)
             return []
 
     async def get_role_permissions(self, role_id: int) -> List[str]:
@@ -175,7 +172,7 @@ class ContextDAO:
             return [rp.permission.slug for rp in role_permissions if rp.permission]
             
         except Exception as e:
-            logger.error(f"Error getting role permissions: {str(e)}")
+            logger.error("Error getting role permissions: %s", e)
             return []
 
     async def get_user_organizations(self, user_id: int) -> List[Dict[str, Any]]:
@@ -197,7 +194,7 @@ class ContextDAO:
             ]
             
         except Exception as e:
-            logger.error(f"Error getting user organizations: {str(e)}")
+            logger.error("Error getting user organizations: %s", e)
             return []
 
     async def get_user_teams(self, user_email: str, organization_id: Optional[int] = None) -> List[Dict[str, Any]]:
@@ -228,7 +225,7 @@ class ContextDAO:
             ]
             
         except Exception as e:
-            logger.error(f"Error getting user teams: {str(e)}")
+            logger.error("Error getting user teams: %s", e)
             return []
 
     async def validate_user_organization_access(self, user_id: int, organization_id: int) -> bool:
@@ -243,7 +240,7 @@ class ContextDAO:
             return result.scalars().first() is not None
             
         except Exception as e:
-            logger.error(f"Error validating user organization access: {str(e)}")
+            logger.error("Error validating user organization access: %s", e)
             return False
 
     async def validate_user_team_access(self, user_id: int, team_id: int) -> bool:
@@ -258,5 +255,5 @@ class ContextDAO:
             return result.scalars().first() is not None
             
         except Exception as e:
-            logger.error(f"Error validating user team access: {str(e)}")
+            logger.error("Error validating user team access: %s", e)
             return False 
\ No newline at end of file
@@ -1,7 +1,9 @@
+import time
 from typing import Dict, List, Optional, Any
-from datetime import datetime, timedelta, timezone
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from auth.models import User
+from auth.utils import ACCESS_TTL
 from context.dao import ContextDAO
 from context.schemas import (
     CurrentContextResponse, AvailableContextsResponse,
@@ -23,7 +25,8 @@ class ContextService:
         user_email: str,
         active_organization_id: Optional[int] = None,
         active_team_id: Optional[int] = None,
-        custom_claims: Optional[Dict[str, Any]] = None
+        custom_claims: Optional[Dict[str, Any]] = None,
+        user: Optional[User] = None
     ) -> Dict[str, Any]:
         """
         Create a JWT payload enriched with user's active context (current org/team)
@@ -33,13 +36,15 @@ class ContextService:
             active_organization_id: ID of the currently active organization
             active_team_id: ID of the currently active team
             custom_claims: Additional custom claims to include
+            user: The already loaded user, if the caller has it; skips the user lookup
             
         Returns:
             Dict containing the enriched payload data
         """
         try:
             # Get user basic info
-            user = await self.dao.get_user_by_email(user_email)
+            if user is None:
+                user = await self.dao.get_user_by_email(user_email)
             if not user:
                 raise ValueError(f"User with email {user_email} not found")
 
@@ -52,7 +57,7 @@ class ContextService:
                 "phone_number": user.phone_number,
                 "verified": user.verified,
                 "auth_type": user.auth_type.value if user.auth_type else "local",
-                "iat": datetime.now(timezone.utc).timestamp(),
+                "iat": time.time(),
             }
 
             # Add active organization context
@@ -85,16 +90,16 @@ class ContextService:
             if custom_claims:
                 payload.update(custom_claims)
 
-            logger.info(f"Created context-enriched payload for user {user_email}")
+            logger.info("Created context-enriched payload for user %s", user_email)
             return payload
 
         except Exception as e:
-            logger.error(f"Error creating context-enriched payload for user {user_email}: {str(e)}")
+            logger.error("Error creating context-enriched payload for user %s: %s", user_email, e)
             # Fall back to basic payload
             return {
                 "sub": user_email,
                 "email": user_email,
-                "iat": datetime.now(timezone.utc).timestamp(),
+                "iat": time.time(),
             }
 
     async def _get_context_permissions(
@@ -121,7 +126,7 @@ class ContextService:
             return list(permissions)
         
         except Exception as e:
-            logger.error(f"Error getting context permissions: {str(e)}")
+            logger.error("Error getting context permissions: %s", e)
             return []
 
     async def validate_user_access_to_organization(self, user_id: int, organization_id: int) -> bool:
@@ -138,7 +143,7 @@ class ContextService:
             team = await self.dao.get_team_by_id(team_id)
             return team is not None and team.organization_id == organization_id
         except Exception as e:
-            logger.error(f"Error validating team organization: {str(e)}")
+            logger.error("Error validating team organization: %s", e)
             return False
 
     async def get_current_context(self, token_payload: Dict[str, Any]) -> CurrentContextResponse:
@@ -175,7 +180,7 @@ class ContextService:
             )
 
         except Exception as e:
-            logger.error(f"Error getting current context: {str(e)}")
+            logger.error("Error getting current context: %s", e)
             return CurrentContextResponse()
 
     async def get_available_contexts(self, user_id: int) -> AvailableContextsResponse:
@@ -195,31 +200,39 @@ class ContextService:
             )
 
         except Exception as e:
-            logger.error(f"Error getting available contexts: {str(e)}")
+            logger.error("Error getting available contexts: %s", e)
             return AvailableContextsResponse(organizations=[], teams=[])
 
     async def create_new_token_with_context(
         self,
         user_email: str,
         organization_id: Optional[int] = None,
-        team_id: Optional[int] = None
+        team_id: Optional[int] = None,
+        user: Optional[User] = None
     ) -> str:
         """Create a new token with specified context"""
         try:
-            expires_delta = timedelta(minutes=settings.access_token_expire_minutes)
+            # Build the payload here with this service's DAO so the auth backend does not set up its own
+            payload = await self.create_context_enriched_payload(
+                user_email=user_email,
+                active_organization_id=organization_id,
+                active_team_id=team_id,
+                user=user
+            )
             
             new_token = await settings.auth_instance.create_context_enriched_token(
                 user_email=user_email,
                 db=self.db,
-                expires_delta=expires_delta,
+                expires_delta=ACCESS_TTL,
                 active_organization_id=organization_id,
-                active_team_id=team_id
+                active_team_id=team_id,
+                prefetched_context=payload
             )
             
             return new_token
             
         except Exception as e:
-            logger.error(f"Error creating new token with context: {str(e)}")
+            logger.error("Error creating new token with context: %s", e)
             raise
 
 
@@ -246,7 +259,7 @@ def extract_context_from_token(token_payload: Dict[str, Any]) -> Dict[str, Any]:
         return context
     
     except Exception as e:
-        logger.error(f"Error extracting context from token: {str(e)}")
+        logger.error("Error extracting context from token: %s", e)
         return {}
 
 
@@ -256,7 +269,7 @@ def check_permission_in_context(token_payload: Dict[str, Any], permission: str)
         permissions = token_payload.get("permissions", [])
         return permission in permissions
     except Exception as e:
-        logger.error(f"Error checking permission in context: {str(e)}")
+        logger.error("Error checking permission in context: %s", e)
         return False
 
 
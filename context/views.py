@@ -40,14 +40,15 @@ async def switch_organization(
         new_token = await context_service.create_new_token_with_context(
             user_email=current_user.email,
             organization_id=request.organization_id,
-            team_id=None  # Reset team when switching orgs
+            team_id=None,  # Reset team when switching orgs
+            user=current_user
         )
         
         # Get context info for response
         payload = await settings.auth_instance.verify_token(new_token)
         context = extract_context_from_token(payload)
         
-        logger.info(f"User {current_user.email} switched to organization {request.organization_id}")
+        logger.info("User %s switched to organization %s", current_user.email, request.organization_id)
         
         return TokenResponse(
             access_token=new_token,
@@ -59,7 +60,7 @@ async def switch_organization(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error switching organization: {str(e)}")
+        logger.error("Error switching organization: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to switch organization"
@@ -101,14 +102,15 @@ async def switch_team(
         new_token = await context_service.create_new_token_with_context(
             user_email=current_user.email,
             organization_id=team.organization_id,
-            team_id=request.team_id
+            team_id=request.team_id,
+            user=current_user
         )
         
         # Get context info for response
         payload = await settings.auth_instance.verify_token(new_token)
         context = extract_context_from_token(payload)
         
-        logger.info(f"User {current_user.email} switched to team {request.team_id}")
+        logger.info("User %s switched to team %s", current_user.email, request.team_id)
         
         return TokenResponse(
             access_token=new_token,
@@ -120,7 +122,7 @@ async def switch_team(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error switching team: {str(e)}")
+        logger.error("Error switching team: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to switch team"
@@ -175,14 +177,15 @@ async def switch_context(
         new_token = await context_service.create_new_token_with_context(
             user_email=current_user.email,
             organization_id=request.organization_id,
-            team_id=request.team_id
+            team_id=request.team_id,
+            user=current_user
         )
         
         # Get context info for response
         payload = await settings.auth_instance.verify_token(new_token)
         context = extract_context_from_token(payload)
         
-        logger.info(f"User {current_user.email} switched context - org: {request.organization_id}, team: {request.team_id}")
+        logger.info("User %s switched context - org: %s, team: %s", current_user.email, request.organization_id, request.team_id)
         
         return TokenResponse(
             access_token=new_token,
@@ -194,7 +197,7 @@ async def switch_context(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error switching context: {str(e)}")
+        logger.error("Error switching context: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to switch context"
@@ -212,7 +215,7 @@ async def get_current_context(
         return await context_service.get_current_context(current_user_token_payload)
         
     except Exception as e:
-        logger.error(f"Error getting current context: {str(e)}")
+        logger.error("Error getting current context: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to get current context"
@@ -231,7 +234,7 @@ async def get_available_contexts(
         return await context_service.get_available_contexts(current_user.id)
         
     except Exception as e:
-        logger.error(f"Error getting available contexts: {str(e)}")
+        logger.error("Error getting available contexts: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to get available contexts"
@@ -1,16 +1,29 @@
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker, declarative_base
 from config.settings import settings
 
+# Statement cache sizes are asyncpg connect() arguments; other drivers would reject them
+connect_args = {}
+if make_url(settings.database_url).drivername == "postgresql+asyncpg":
+    connect_args = {
+        "statement_cache_size": 1024,  # asyncpg server-side prepared statement cache
+        "prepared_statement_cache_size": 256,  # SQLAlchemy asyncpg dialect statement cache
+    }
+
 engine = create_async_engine(
     settings.database_url,
     echo=False,
     future=True,
     pool_size=10,  # Number of connections to keep persistently
     max_overflow=20,  # Additional connections that can be created on demand
-    pool_pre_ping=True,  # Validate connections before use
-    pool_recycle=3600,  # Recycle connections after 1 hour
+    # No ping round trip on every checkout; connections are recycled well before typical server/proxy idle
+    # limits instead, and a connection that does drop is invalidated by SQLAlchemy's disconnect handling
+    pool_pre_ping=False,
+    pool_recycle=1800,  # Recycle connections after 30 minutes
     pool_timeout=30,  # Timeout when getting connection from pool
+    query_cache_size=1200,  # SQL compilation cache entries shared by all connections
+    connect_args=connect_args,
 )
 
 SessionLocal = sessionmaker(
@@ -28,5 +41,5 @@ async def get_db() -> AsyncSession:
         try:
             yield session
         finally:
-            # Ensure proper cleanup - session is automatically closed by async context manager
+            # Closing the session rolls back any uncommitted work, so services need not roll back on error
             pass
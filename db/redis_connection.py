@@ -14,7 +14,7 @@ class RedisClient:
         """Connect to Redis."""
         if not self.redis:
             self.redis = redis.from_url(self.redis_url, decode_responses=True)
-            logger.info(f"Connected to Redis at {self.redis_url}")
+            logger.info("Connected to Redis at %s", self.redis_url)
 
     async def close(self):
         """Close the Redis connection."""
@@ -29,9 +29,9 @@ class RedisClient:
                 await self.redis.setex(key, expire, value)
             else:
                 await self.redis.set(key, value)
-            logger.info(f"Set key '{key}' in Redis with value: {value}")
+            logger.info("Set key '%s' in Redis with value: %s", key, value)
         except Exception as e:
-            logger.error(f"Error setting key '{key}' in Redis: {e}")
+            logger.error("Error setting key '%s' in Redis: %s", key, e)
             raise HTTPException(status_code=500, detail="Error interacting with Redis")
 
     async def get(self, key: str) -> Optional[str]:
@@ -39,19 +39,30 @@ class RedisClient:
         try:
             value = await self.redis.get(key)
             if value is None:
-                logger.warning(f"Key '{key}' not found in Redis.")
+                logger.warning("Key '%s' not found in Redis.", key)
             return value
         except Exception as e:
-            logger.error(f"Error getting key '{key}' from Redis: {e}")
+            logger.error("Error getting key '%s' from Redis: %s", key, e)
+            raise HTTPException(status_code=500, detail="Error interacting with Redis")
+
+    async def getdel(self, key: str) -> Optional[str]:
+        """Get a value and delete its key in a single round trip (GETDEL, Redis 6.2+)."""
+        try:
+            value = await self.redis.getdel(key)
+            if value is None:
+                logger.warning("Key '%s' not found in Redis.", key)
+            return value
+        except Exception as e:
+            logger.error("Error getting and deleting key '%s' from Redis: %s", key, e)
             raise HTTPException(status_code=500, detail="Error interacting with Redis")
 
     async def delete(self, key: str):
         """Delete a key from Redis."""
         try:
             await self.redis.delete(key)
-            logger.info(f"Deleted key '{key}' from Redis.")
+            logger.info("Deleted key '%s' from Redis.", key)
         except Exception as e:
-            logger.error(f"Error deleting key '{key}' from Redis: {e}")
+            logger.error("Error deleting key '%s' from Redis: %s", key, e)
             raise HTTPException(status_code=500, detail="Error interacting with Redis")
 
     async def exists(self, key: str) -> bool:
@@ -60,5 +71,5 @@ class RedisClient:
             exists = await self.redis.exists(key)
             return exists == 1
         except Exception as e:
-            logger.error(f"Error checking existence of key '{key}' in Redis: {e}")
+            logger.error("Error checking existence of key '%s' in Redis: %s", key, e)
             raise HTTPException(status_code=500, detail="Error interacting with Redis")
@@ -16,7 +16,6 @@ class OrganizationDAO:
         db_org = Organization(name=org_data.name)
         self.db.add(db_org)
         await self.db.commit()
-        await self.db.refresh(db_org)
         return db_org
 
     async def get_organization_by_id(self, org_id: int) -> Optional[Organization]:
@@ -31,7 +30,6 @@ class OrganizationDAO:
         )
         self.db.add(org_user)
         await self.db.commit()
-        await self.db.refresh(org_user)
         return org_user
 
     async def get_organization_user(
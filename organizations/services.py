@@ -35,7 +35,7 @@ class OrganizationService:
                 organization_id=db_org.id, user_id=current_user.id, role_id=admin_role.id
             )
             
-            logger.info(f"Organization '{db_org.name}' created by user {current_user.email}")
+            logger.info("Organization '%s' created by user %s", db_org.name, current_user.email)
             
             return ResponseData(
                 success=True,
@@ -43,8 +43,10 @@ class OrganizationService:
                 data=OrganizationRead.model_validate(db_org).model_dump()
             ).model_dump()
             
+        except InternalServerError:
+            raise
         except Exception as e:
-            logger.error(f"Error creating organization in service: {e}")
+            logger.error("Error creating organization in service: %s", e)
             raise InternalServerError("Failed to create organization", "ORGANIZATION_CREATION_ERROR")
 
     async def get_organization_by_id(self, organization_id: int, current_user: User) -> dict:
@@ -70,7 +72,7 @@ class OrganizationService:
         except (NotFoundError, UnauthorizedError):
             raise
         except Exception as e:
-            logger.error(f"Error retrieving organization {organization_id}: {e}")
+            logger.error("Error retrieving organization %s: %s", organization_id, e)
             raise InternalServerError("Failed to retrieve organization", "ORGANIZATION_RETRIEVAL_ERROR")
 
     async def get_user_organizations(self, current_user: User) -> dict:
@@ -85,7 +87,7 @@ class OrganizationService:
                 org_user_data = OrganizationUserRead.model_validate(org_user)
                 organizations_data.append(org_user_data.model_dump())
             
-            logger.info(f"Retrieved {len(organizations_data)} organizations for user {current_user.email}")
+            logger.info("Retrieved %s organizations for user %s", len(organizations_data), current_user.email)
             
             return ResponseData(
                 success=True,
@@ -94,7 +96,7 @@ class OrganizationService:
             ).model_dump()
             
         except Exception as e:
-            logger.error(f"Error retrieving user organizations: {e}")
+            logger.error("Error retrieving user organizations: %s", e)
             raise InternalServerError("Failed to retrieve user organizations", "USER_ORGANIZATIONS_ERROR")
 
     async def get_organization_members(self, organization_id: int, current_user: User) -> dict:
@@ -129,7 +131,7 @@ class OrganizationService:
                 }
                 members_data.append(member_data)
             
-            logger.info(f"Retrieved {len(members_data)} members for organization {organization_id}")
+            logger.info("Retrieved %s members for organization %s", len(members_data), organization_id)
             
             return ResponseData(
                 success=True,
@@ -140,7 +142,7 @@ class OrganizationService:
         except UnauthorizedError:
             raise
         except Exception as e:
-            logger.error(f"Error retrieving organization members: {e}")
+            logger.error("Error retrieving organization members: %s", e)
             raise InternalServerError("Failed to retrieve organization members", "ORGANIZATION_MEMBERS_ERROR")
 
     async def update_organization(self, organization_id: int, org_data: dict, current_user: User) -> dict:
@@ -164,7 +166,7 @@ class OrganizationService:
         except UnauthorizedError:
             raise
         except Exception as e:
-            logger.error(f"Error updating organization {organization_id}: {e}")
+            logger.error("Error updating organization %s: %s", organization_id, e)
             raise InternalServerError("Failed to update organization", "ORGANIZATION_UPDATE_ERROR")
 
     async def remove_user_from_organization(self, organization_id: int, user_id: int, current_user: User) -> dict:
@@ -188,7 +190,7 @@ class OrganizationService:
             if target_membership.role.name == "Admin":
                 # This would require a method to count admins
                 # For now, we'll allow it but add a warning
-                logger.warning(f"Removing admin user {user_id} from organization {organization_id}")
+                logger.warning("Removing admin user %s from organization %s", user_id, organization_id)
             
             # This would require a remove method in DAO
             # For now, returning a placeholder
@@ -200,7 +202,7 @@ class OrganizationService:
         except (NotFoundError, UnauthorizedError):
             raise
         except Exception as e:
-            logger.error(f"Error removing user from organization: {e}")
+            logger.error("Error removing user from organization: %s", e)
             raise InternalServerError("Failed to remove user from organization", "USER_REMOVAL_ERROR")
 
     async def assign_user_to_organization(
@@ -244,7 +246,7 @@ class OrganizationService:
                 organization_id=organization_id, user_id=target_user.id, role_id=role_id
             )
             
-            logger.info(f"User {user_email} added to organization {organization_id}")
+            logger.info("User %s added to organization %s", user_email, organization_id)
             
             return ResponseData(
                 success=True,
@@ -254,5 +256,5 @@ class OrganizationService:
         except (UnauthorizedError, ConflictError):
             raise
         except Exception as e:
-            logger.error(f"Error assigning user to organization: {e}")
+            logger.error("Error assigning user to organization: %s", e)
             raise InternalServerError("Failed to assign user to organization", "USER_ASSIGNMENT_ERROR")
\ No newline at end of file
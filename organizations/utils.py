@@ -1,8 +1,9 @@
-import json
-import uuid
+import secrets
 from datetime import timedelta
 from urllib.parse import urljoin
 
+import orjson
+
 from config.settings import settings
 from html_templates.invite_template import invitation_template
 from utils.custom_logger import logger
@@ -12,7 +13,7 @@ from utils.email_provider import send_mail
 async def send_invite_email(redis_client, email, organization_id: int, role_id: int, title):
     try:
         # Generate a unique verification token
-        verification_token = uuid.uuid4()
+        verification_token = secrets.token_urlsafe(16)
         token_key = f"{title}:{verification_token}"
 
         value = {
@@ -21,7 +22,7 @@ async def send_invite_email(redis_client, email, organization_id: int, role_id:
             "role_id": role_id
         }
 
-        await redis_client.set(token_key, json.dumps(value), expire=timedelta(hours=24))
+        await redis_client.set(token_key, orjson.dumps(value).decode(), expire=timedelta(hours=24))
 
         invitation_url = urljoin(
             settings.hinata_host,
@@ -41,5 +42,5 @@ async def send_invite_email(redis_client, email, organization_id: int, role_id:
 
         logger.info("Invitation email sent successfully.")
     except Exception as e:
-        logger.error(f"Failed to send invitation email: {e}")
+        logger.error("Failed to send invitation email: %s", e)
         raise e
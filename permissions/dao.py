@@ -35,7 +35,7 @@ class PermissionDAO:
             result = await self.db.execute(select(Permission))
             return result.scalars().all()
         except Exception as e:
-            logger.error(f"Error retrieving all permissions: {str(e)}")
+            logger.error("Error retrieving all permissions: %s", e)
             raise
 
     async def get_permission_by_id(self, permission_id: int) -> Optional[Permission]:
@@ -44,7 +44,7 @@ class PermissionDAO:
             result = await self.db.execute(select(Permission).where(Permission.id == permission_id))
             return result.scalars().first()
         except Exception as e:
-            logger.error(f"Error retrieving permission by ID {permission_id}: {str(e)}")
+            logger.error("Error retrieving permission by ID %s: %s", permission_id, e)
             raise
 
     async def get_permission_by_name(self, name: str) -> Optional[Permission]:
@@ -53,7 +53,7 @@ class PermissionDAO:
             result = await self.db.execute(select(Permission).where(Permission.name == name))
             return result.scalars().first()
         except Exception as e:
-            logger.error(f"Error retrieving permission by name '{name}': {str(e)}")
+            logger.error("Error retrieving permission by name '%s': %s", name, e)
             raise
 
     async def create_permission(self, permission_data: dict) -> Permission:
@@ -62,7 +62,6 @@ class PermissionDAO:
             db_permission = Permission(**permission_data)
             self.db.add(db_permission)
             await self.db.commit()
-            await self.db.refresh(db_permission)
             
             # Refresh cache after successful creation
             logger.info("Refreshing permissions cache after creating new permission")
@@ -70,7 +69,7 @@ class PermissionDAO:
             
             return db_permission
         except Exception as e:
-            logger.error(f"Error creating permission: {str(e)}")
+            logger.error("Error creating permission: %s", e)
             await self.db.rollback()
             raise
 
@@ -93,7 +92,7 @@ class PermissionDAO:
             
             return updated_permission
         except Exception as e:
-            logger.error(f"Error updating permission {permission_id}: {str(e)}")
+            logger.error("Error updating permission %s: %s", permission_id, e)
             await self.db.rollback()
             raise
 
@@ -111,7 +110,7 @@ class PermissionDAO:
             
             return success
         except Exception as e:
-            logger.error(f"Error deleting permission {permission_id}: {str(e)}")
+            logger.error("Error deleting permission %s: %s", permission_id, e)
             await self.db.rollback()
             raise
 
@@ -132,7 +131,7 @@ class PermissionDAO:
             role_permission = RolePermission(role_id=role_id, permission_id=permission_id)
             self.db.add(role_permission)
             await self.db.commit()
-            logger.info(f"Permission {permission_id} assigned to role {role_id}")
+            logger.info("Permission %s assigned to role %s", permission_id, role_id)
             
             # Refresh cache after successful assignment
             logger.info("Refreshing permissions cache after assigning permission to role")
@@ -140,7 +139,7 @@ class PermissionDAO:
             
             return True
         except Exception as e:
-            logger.error(f"Error assigning permission {permission_id} to role {role_id}: {str(e)}")
+            logger.error("Error assigning permission %s to role %s: %s", permission_id, role_id, e)
             await self.db.rollback()
             raise
 
@@ -154,7 +153,7 @@ class PermissionDAO:
                 )
             )
             await self.db.commit()
-            logger.info(f"Permission {permission_id} removed from role {role_id}")
+            logger.info("Permission %s removed from role %s", permission_id, role_id)
             success = result.rowcount > 0
             
             if success:
@@ -164,7 +163,7 @@ class PermissionDAO:
             
             return success
         except Exception as e:
-            logger.error(f"Error removing permission {permission_id} from role {role_id}: {str(e)}")
+            logger.error("Error removing permission %s from role %s: %s", permission_id, role_id, e)
             await self.db.rollback()
             raise
 
@@ -176,7 +175,7 @@ class PermissionDAO:
             )
             return result.scalars().first() is not None
         except Exception as e:
-            logger.error(f"Error checking permission usage {permission_id}: {str(e)}")
+            logger.error("Error checking permission usage %s: %s", permission_id, e)
             raise
 
     async def get_permissions_by_role(self, role_id: int) -> List[Permission]:
@@ -191,7 +190,7 @@ class PermissionDAO:
             )
             return result.scalars().all()
         except Exception as e:
-            logger.error(f"Error retrieving permissions for role {role_id}: {str(e)}")
+            logger.error("Error retrieving permissions for role %s: %s", role_id, e)
             raise
 
     async def get_roles_by_permission(self, permission_id: int) -> List[int]:
@@ -202,7 +201,7 @@ class PermissionDAO:
             )
             return [row[0] for row in result.fetchall()]
         except Exception as e:
-            logger.error(f"Error retrieving roles for permission {permission_id}: {str(e)}")
+            logger.error("Error retrieving roles for permission %s: %s", permission_id, e)
             raise
 
     async def get_permissions_by_scope_from_db(self, scope: str) -> List[Permission]:
@@ -211,5 +210,5 @@ class PermissionDAO:
             result = await self.db.execute(select(Permission).where(Permission.scope == scope))
             return result.scalars().all()
         except Exception as e:
-            logger.error(f"Error retrieving permissions by scope '{scope}': {str(e)}")
+            logger.error("Error retrieving permissions by scope '%s': %s", scope, e)
             raise 
\ No newline at end of file
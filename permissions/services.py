@@ -26,7 +26,7 @@ class PermissionService:
         """Retrieve all permissions with business logic"""
         try:
             permissions = await self.permission_dao.get_all_permissions()
-            logger.info(f"Retrieved {len(permissions)} permissions")
+            logger.info("Retrieved %s permissions", len(permissions))
             
             return ResponseData(
                 success=True,
@@ -41,7 +41,7 @@ class PermissionService:
             ).model_dump()
             
         except Exception as e:
-            logger.error(f"Error retrieving permissions: {str(e)}")
+            logger.error("Error retrieving permissions: %s", e)
             raise InternalServerError("Failed to retrieve permissions", "PERMISSIONS_RETRIEVAL_ERROR")
 
     async def retrieve_permission_by_id(self, permission_id: int) -> dict:
@@ -49,10 +49,10 @@ class PermissionService:
         try:
             permission = await self.permission_dao.get_permission_by_id(permission_id)
             if not permission:
-                logger.warning(f"Permission with ID {permission_id} not found")
+                logger.warning("Permission with ID %s not found", permission_id)
                 raise NotFoundError(f"Permission with ID {permission_id} not found", "PERMISSION_NOT_FOUND")
             
-            logger.info(f"Retrieved permission: {permission.name}")
+            logger.info("Retrieved permission: %s", permission.name)
             
             return ResponseData(
                 success=True,
@@ -69,7 +69,7 @@ class PermissionService:
         except NotFoundError:
             raise
         except Exception as e:
-            logger.error(f"Error retrieving permission {permission_id}: {str(e)}")
+            logger.error("Error retrieving permission %s: %s", permission_id, e)
             raise InternalServerError("Failed to retrieve permission", "PERMISSION_RETRIEVAL_ERROR")
 
     async def retrieve_permission_by_name(self, name: str) -> dict:
@@ -77,10 +77,10 @@ class PermissionService:
         try:
             permission = await self.permission_dao.get_permission_by_name(name)
             if not permission:
-                logger.info(f"Permission '{name}' not found")
+                logger.info("Permission '%s' not found", name)
                 raise NotFoundError(f"Permission '{name}' not found", "PERMISSION_NOT_FOUND")
                 
-            logger.info(f"Found permission: {permission.name}")
+            logger.info("Found permission: %s", permission.name)
             
             return ResponseData(
                 success=True,
@@ -97,14 +97,14 @@ class PermissionService:
         except NotFoundError:
             raise
         except Exception as e:
-            logger.error(f"Error retrieving permission by name '{name}': {str(e)}")
+            logger.error("Error retrieving permission by name '%s': %s", name, e)
             raise InternalServerError("Failed to retrieve permission", "PERMISSION_RETRIEVAL_ERROR")
 
     async def get_permissions_by_role(self, role_id: int) -> dict:
         """Get all permissions assigned to a specific role"""
         try:
             permissions = await self.permission_dao.get_permissions_by_role(role_id)
-            logger.info(f"Retrieved {len(permissions)} permissions for role {role_id}")
+            logger.info("Retrieved %s permissions for role %s", len(permissions), role_id)
             
             return ResponseData(
                 success=True,
@@ -119,7 +119,7 @@ class PermissionService:
             ).model_dump()
             
         except Exception as e:
-            logger.error(f"Error retrieving permissions for role {role_id}: {str(e)}")
+            logger.error("Error retrieving permissions for role %s: %s", role_id, e)
             raise InternalServerError("Failed to retrieve role permissions", "ROLE_PERMISSIONS_ERROR")
 
     async def get_permissions_by_scope(self, scope: str) -> dict:
@@ -128,7 +128,7 @@ class PermissionService:
             # Try to get from cache first
             cached_scope_permissions = get_cached_permissions_by_scope(scope)
             if cached_scope_permissions:
-                logger.info(f"Retrieved permissions for scope '{scope}' from cache")
+                logger.info("Retrieved permissions for scope '%s' from cache", scope)
                 # Convert cache format to expected response format
                 # Cache contains role->permission mapping, we need to extract unique permissions
                 all_permissions_in_scope = []
@@ -156,10 +156,10 @@ class PermissionService:
                     ).model_dump()
             
             # Fallback to database
-            logger.info(f"Cache miss or empty, retrieving permissions for scope '{scope}' from database")
+            logger.info("Cache miss or empty, retrieving permissions for scope '%s' from database", scope)
             permissions = await self.permission_dao.get_permissions_by_scope_from_db(scope)
             
-            logger.info(f"Retrieved {len(permissions)} permissions with scope '{scope}' from database")
+            logger.info("Retrieved %s permissions with scope '%s' from database", len(permissions), scope)
             
             return ResponseData(
                 success=True,
@@ -174,7 +174,7 @@ class PermissionService:
             ).model_dump()
             
         except Exception as e:
-            logger.error(f"Error retrieving permissions by scope '{scope}': {str(e)}")
+            logger.error("Error retrieving permissions by scope '%s': %s", scope, e)
             raise InternalServerError("Failed to retrieve permissions by scope", "SCOPE_PERMISSIONS_ERROR")
 
     async def create_new_permission(self, permission_data: dict) -> dict:
@@ -185,7 +185,7 @@ class PermissionService:
                 permission_data.get("name")
             )
             if existing_permission:
-                logger.warning(f"Permission '{permission_data.get('name')}' already exists")
+                logger.warning("Permission '%s' already exists", permission_data.get('name'))
                 raise ConflictError(f"Permission '{permission_data.get('name')}' already exists", "PERMISSION_EXISTS")
 
             # Create slug if not provided
@@ -208,7 +208,7 @@ class PermissionService:
 
             # Create permission - DAO will handle cache refresh
             permission = await self.permission_dao.create_permission(permission_data)
-            logger.info(f"Created new permission: {permission.name}")
+            logger.info("Created new permission: %s", permission.name)
             
             return ResponseData(
                 success=True,
@@ -225,7 +225,7 @@ class PermissionService:
         except (ConflictError, CustomValidationError):
             raise
         except Exception as e:
-            logger.error(f"Error creating permission: {str(e)}")
+            logger.error("Error creating permission: %s", e)
             raise InternalServerError("Failed to create permission", "PERMISSION_CREATION_ERROR")
 
     async def modify_permission(self, permission_id: int, permission_data: dict) -> dict:
@@ -234,7 +234,7 @@ class PermissionService:
             # Check if permission exists
             existing_permission = await self.permission_dao.get_permission_by_id(permission_id)
             if not existing_permission:
-                logger.warning(f"Permission with ID {permission_id} not found")
+                logger.warning("Permission with ID %s not found", permission_id)
                 raise NotFoundError(f"Permission with ID {permission_id} not found", "PERMISSION_NOT_FOUND")
 
             # Check name uniqueness if name is being updated
@@ -243,7 +243,7 @@ class PermissionService:
                     permission_data["name"]
                 )
                 if name_conflict and name_conflict.id != permission_id:
-                    logger.warning(f"Permission name '{permission_data['name']}' already exists")
+                    logger.warning("Permission name '%s' already exists", permission_data['name'])
                     raise ConflictError(f"Permission name '{permission_data['name']}' already exists", "PERMISSION_NAME_EXISTS")
 
             # Update slug if name is changed
@@ -264,7 +264,7 @@ class PermissionService:
             if not updated_permission:
                 raise InternalServerError("Failed to update permission", "PERMISSION_UPDATE_FAILED")
                 
-            logger.info(f"Updated permission: {updated_permission.name}")
+            logger.info("Updated permission: %s", updated_permission.name)
             
             return ResponseData(
                 success=True,
@@ -281,7 +281,7 @@ class PermissionService:
         except (NotFoundError, ConflictError, CustomValidationError, InternalServerError):
             raise
         except Exception as e:
-            logger.error(f"Error updating permission {permission_id}: {str(e)}")
+            logger.error("Error updating permission %s: %s", permission_id, e)
             raise InternalServerError("Failed to update permission", "PERMISSION_UPDATE_ERROR")
 
     async def remove_permission(self, permission_id: int) -> dict:
@@ -290,13 +290,13 @@ class PermissionService:
             # Check if permission exists
             existing_permission = await self.permission_dao.get_permission_by_id(permission_id)
             if not existing_permission:
-                logger.warning(f"Permission with ID {permission_id} not found")
+                logger.warning("Permission with ID %s not found", permission_id)
                 raise NotFoundError(f"Permission with ID {permission_id} not found", "PERMISSION_NOT_FOUND")
 
             # Check if permission is being used (business logic)
             is_used = await self._check_permission_usage(permission_id)
             if is_used:
-                logger.warning(f"Cannot delete permission {permission_id} - it's currently in use")
+                logger.warning("Cannot delete permission %s - it's currently in use", permission_id)
                 raise ConflictError("Cannot delete permission - it's currently assigned to roles", "PERMISSION_IN_USE")
 
             # Delete permission - DAO will handle cache refresh
@@ -304,7 +304,7 @@ class PermissionService:
             if not success:
                 raise InternalServerError("Failed to delete permission", "PERMISSION_DELETE_FAILED")
                 
-            logger.info(f"Deleted permission: {existing_permission.name}")
+            logger.info("Deleted permission: %s", existing_permission.name)
             
             return ResponseData(
                 success=True,
@@ -314,7 +314,7 @@ class PermissionService:
         except (NotFoundError, ConflictError, InternalServerError):
             raise
         except Exception as e:
-            logger.error(f"Error deleting permission {permission_id}: {str(e)}")
+            logger.error("Error deleting permission %s: %s", permission_id, e)
             raise InternalServerError("Failed to delete permission", "PERMISSION_DELETE_ERROR")
 
     async def assign_permission_to_role(self, role_id: int, permission_id: int) -> dict:
@@ -330,7 +330,7 @@ class PermissionService:
             if not success:
                 raise ConflictError("Permission already assigned to role", "ASSIGNMENT_EXISTS")
 
-            logger.info(f"Permission {permission_id} assigned to role {role_id}")
+            logger.info("Permission %s assigned to role %s", permission_id, role_id)
             
             return ResponseData(
                 success=True,
@@ -340,7 +340,7 @@ class PermissionService:
         except (NotFoundError, ConflictError):
             raise
         except Exception as e:
-            logger.error(f"Error assigning permission {permission_id} to role {role_id}: {str(e)}")
+            logger.error("Error assigning permission %s to role %s: %s", permission_id, role_id, e)
             raise InternalServerError("Failed to assign permission to role", "ASSIGNMENT_ERROR")
 
     async def remove_permission_from_role(self, role_id: int, permission_id: int) -> dict:
@@ -351,7 +351,7 @@ class PermissionService:
             if not success:
                 raise NotFoundError("Permission assignment not found", "ASSIGNMENT_NOT_FOUND")
 
-            logger.info(f"Permission {permission_id} removed from role {role_id}")
+            logger.info("Permission %s removed from role %s", permission_id, role_id)
             
             return ResponseData(
                 success=True,
@@ -361,7 +361,7 @@ class PermissionService:
         except NotFoundError:
             raise
         except Exception as e:
-            logger.error(f"Error removing permission {permission_id} from role {role_id}: {str(e)}")
+            logger.error("Error removing permission %s from role %s: %s", permission_id, role_id, e)
             raise InternalServerError("Failed to remove permission from role", "REMOVAL_ERROR")
 
     async def _check_permission_usage(self, permission_id: int) -> bool:
@@ -369,6 +369,6 @@ class PermissionService:
         try:
             return await self.permission_dao.is_permission_in_use(permission_id)
         except Exception as e:
-            logger.warning(f"Could not check permission usage: {str(e)}")
+            logger.warning("Could not check permission usage: %s", e)
             # If we can't check, assume it's safe to delete
             return False 
\ No newline at end of file
@@ -26,10 +26,9 @@ class RoleDAO:
             role = Role(**role_data)
             self.db.add(role)
             await self.db.commit()
-            await self.db.refresh(role)
             return role
         except Exception as e:
-            logger.error(f"Error creating role: {str(e)}")
+            logger.error("Error creating role: %s", e)
             await self.db.rollback()
             raise
 
@@ -39,7 +38,7 @@ class RoleDAO:
             result = await self.db.execute(select(Role).where(Role.id == role_id))
             return result.scalars().first()
         except Exception as e:
-            logger.error(f"Error getting role by ID {role_id}: {str(e)}")
+            logger.error("Error getting role by ID %s: %s", role_id, e)
             raise
 
     async def get_role_by_name(self, name: str) -> Optional[Role]:
@@ -48,7 +47,7 @@ class RoleDAO:
             result = await self.db.execute(select(Role).where(Role.name == name))
             return result.scalars().first()
         except Exception as e:
-            logger.error(f"Error getting role by name '{name}': {str(e)}")
+            logger.error("Error getting role by name '%s': %s", name, e)
             raise
 
     async def get_role_by_slug(self, slug: str) -> Optional[Role]:
@@ -57,7 +56,7 @@ class RoleDAO:
             result = await self.db.execute(select(Role).where(Role.slug == slug))
             return result.scalars().first()
         except Exception as e:
-            logger.error(f"Error getting role by slug '{slug}': {str(e)}")
+            logger.error("Error getting role by slug '%s': %s", slug, e)
             raise
 
     async def get_all_roles(self) -> List[Role]:
@@ -66,7 +65,7 @@ class RoleDAO:
             result = await self.db.execute(select(Role))
             return result.scalars().all()
         except Exception as e:
-            logger.error(f"Error getting all roles: {str(e)}")
+            logger.error("Error getting all roles: %s", e)
             raise
 
     async def update_role(self, role_id: int, role_data: dict) -> Optional[Role]:
@@ -81,7 +80,7 @@ class RoleDAO:
             await self.db.commit()
             return result.scalars().first()
         except Exception as e:
-            logger.error(f"Error updating role {role_id}: {str(e)}")
+            logger.error("Error updating role %s: %s", role_id, e)
             await self.db.rollback()
             raise
 
@@ -94,7 +93,7 @@ class RoleDAO:
             await self.db.commit()
             return result.rowcount > 0
         except Exception as e:
-            logger.error(f"Error deleting role {role_id}: {str(e)}")
+            logger.error("Error deleting role %s: %s", role_id, e)
             await self.db.rollback()
             raise
 
@@ -106,10 +105,10 @@ class RoleDAO:
             # role_permission = RolePermission(role_id=role_id, permission_id=permission_id)
             # self.db.add(role_permission)
             # await self.db.commit()
-            logger.info(f"Permission {permission_id} assigned to role {role_id}")
+            logger.info("Permission %s assigned to role %s", permission_id, role_id)
             return True
         except Exception as e:
-            logger.error(f"Error assigning permission {permission_id} to role {role_id}: {str(e)}")
+            logger.error("Error assigning permission %s to role %s: %s", permission_id, role_id, e)
             await self.db.rollback()
             raise
 
@@ -126,10 +125,10 @@ class RoleDAO:
             # )
             # await self.db.commit()
             # return result.rowcount > 0
-            logger.info(f"Permission {permission_id} removed from role {role_id}")
+            logger.info("Permission %s removed from role %s", permission_id, role_id)
             return True
         except Exception as e:
-            logger.error(f"Error removing permission {permission_id} from role {role_id}: {str(e)}")
+            logger.error("Error removing permission %s from role %s: %s", permission_id, role_id, e)
             await self.db.rollback()
             raise
 
@@ -144,7 +143,7 @@ class RoleDAO:
             # return result.scalars().first() is not None
             return False
         except Exception as e:
-            logger.error(f"Error checking role usage {role_id}: {str(e)}")
+            logger.error("Error checking role usage %s: %s", role_id, e)
             raise
 
     async def get_role_by_name_and_scope(self, name: str, scope: str) -> Optional[Role]:
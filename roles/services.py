@@ -30,14 +30,14 @@ class RoleService:
             # Check for existing role by name
             existing_by_name = await self.role_dao.get_role_by_name(role_data.name)
             if existing_by_name:
-                logger.warning(f"Role creation attempt with existing name: {role_data.name}")
+                logger.warning("Role creation attempt with existing name: %s", role_data.name)
                 raise ConflictError(f"Role with name '{role_data.name}' already exists", "ROLE_NAME_EXISTS")
 
             # Check for existing role by slug if provided
             if role_data.slug:
                 existing_by_slug = await self.role_dao.get_role_by_slug(role_data.slug)
                 if existing_by_slug:
-                    logger.warning(f"Role creation attempt with existing slug: {role_data.slug}")
+                    logger.warning("Role creation attempt with existing slug: %s", role_data.slug)
                     raise ConflictError(f"Role with slug '{role_data.slug}' already exists", "ROLE_SLUG_EXISTS")
 
             # Create the role
@@ -51,7 +51,7 @@ class RoleService:
             if not created_role:
                 raise InternalServerError("Failed to create role", "ROLE_CREATION_FAILED")
 
-            logger.info(f"Role '{created_role.name}' created successfully by user {current_user.email}")
+            logger.info("Role '%s' created successfully by user %s", created_role.name, current_user.email)
             
             return ResponseData(
                 success=True,
@@ -68,13 +68,13 @@ class RoleService:
         except (ConflictError, UnauthorizedError, InternalServerError):
             raise
         except IntegrityError:
-            logger.warning(f"Database integrity error during role creation for name '{role_data.name}'")
+            logger.warning("Database integrity error during role creation for name '%s'", role_data.name)
             raise ConflictError("A role with this name or slug already exists", "ROLE_ALREADY_EXISTS")
         except ValueError as ve:
-            logger.error(f"Validation error during role creation: {ve}")
+            logger.error("Validation error during role creation: %s", ve)
             raise ValidationError(str(ve), "ROLE_VALIDATION_ERROR")
         except Exception as e:
-            logger.error(f"Unexpected error in role creation: {e}", exc_info=True)
+            logger.error("Unexpected error in role creation: %s", e, exc_info=True)
             raise InternalServerError("An unexpected error occurred while creating the role", "ROLE_CREATION_ERROR")
 
     async def retrieve_role_by_id(self, role_id: int, current_user: User) -> dict:
@@ -85,10 +85,10 @@ class RoleService:
 
             role = await self.role_dao.get_role_by_id(role_id)
             if not role:
-                logger.warning(f"Role with ID {role_id} not found")
+                logger.warning("Role with ID %s not found", role_id)
                 raise NotFoundError(f"Role with ID {role_id} not found", "ROLE_NOT_FOUND")
 
-            logger.info(f"Role {role.name} retrieved by user {current_user.email}")
+            logger.info("Role %s retrieved by user %s", role.name, current_user.email)
             
             return ResponseData(
                 success=True,
@@ -105,7 +105,7 @@ class RoleService:
         except (NotFoundError, UnauthorizedError):
             raise
         except Exception as e:
-            logger.error(f"Error fetching role by ID {role_id}: {e}", exc_info=True)
+            logger.error("Error fetching role by ID %s: %s", role_id, e, exc_info=True)
             raise InternalServerError("Failed to retrieve role", "ROLE_FETCH_ERROR")
 
     async def retrieve_role_by_slug(self, slug: str, current_user: User) -> dict:
@@ -116,10 +116,10 @@ class RoleService:
 
             role = await self.role_dao.get_role_by_slug(slug)
             if not role:
-                logger.warning(f"Role with slug '{slug}' not found")
+                logger.warning("Role with slug '%s' not found", slug)
                 raise NotFoundError(f"Role with slug '{slug}' not found", "ROLE_NOT_FOUND")
 
-            logger.info(f"Role {role.name} retrieved by slug by user {current_user.email}")
+            logger.info("Role %s retrieved by slug by user %s", role.name, current_user.email)
             
             return ResponseData(
                 success=True,
@@ -136,7 +136,7 @@ class RoleService:
         except (NotFoundError, UnauthorizedError):
             raise
         except Exception as e:
-            logger.error(f"Error fetching role by slug '{slug}': {e}", exc_info=True)
+            logger.error("Error fetching role by slug '%s': %s", slug, e, exc_info=True)
             raise InternalServerError("Failed to retrieve role", "ROLE_FETCH_ERROR")
 
     async def retrieve_all_roles(self, current_user: User) -> dict:
@@ -146,7 +146,7 @@ class RoleService:
                 raise UnauthorizedError("Authentication required", "AUTH_REQUIRED")
 
             roles = await self.role_dao.get_all_roles()
-            logger.info(f"Retrieved {len(roles)} roles for user {current_user.email}")
+            logger.info("Retrieved %s roles for user %s", len(roles), current_user.email)
             
             return ResponseData(
                 success=True,
@@ -163,7 +163,7 @@ class RoleService:
         except UnauthorizedError:
             raise
         except Exception as e:
-            logger.error(f"Error retrieving all roles: {e}", exc_info=True)
+            logger.error("Error retrieving all roles: %s", e, exc_info=True)
             raise InternalServerError("Failed to retrieve roles", "ROLES_FETCH_ERROR")
 
     async def modify_role(self, role_id: int, role_data: dict, current_user: User) -> dict:
@@ -175,21 +175,21 @@ class RoleService:
             # Check if role exists
             existing_role = await self.role_dao.get_role_by_id(role_id)
             if not existing_role:
-                logger.warning(f"Role update attempt for non-existent ID: {role_id}")
+                logger.warning("Role update attempt for non-existent ID: %s", role_id)
                 raise NotFoundError(f"Role with ID {role_id} not found", "ROLE_NOT_FOUND")
 
             # Validate name uniqueness if name is being updated
             if "name" in role_data and role_data["name"] != existing_role.name:
                 name_conflict = await self.role_dao.get_role_by_name(role_data["name"])
                 if name_conflict and name_conflict.id != role_id:
-                    logger.warning(f"Role name conflict during update: {role_data['name']}")
+                    logger.warning("Role name conflict during update: %s", role_data['name'])
                     raise ConflictError(f"Role name '{role_data['name']}' already exists", "ROLE_NAME_EXISTS")
 
             # Validate slug uniqueness if slug is being updated
             if "slug" in role_data and role_data["slug"] != existing_role.slug:
                 slug_conflict = await self.role_dao.get_role_by_slug(role_data["slug"])
                 if slug_conflict and slug_conflict.id != role_id:
-                    logger.warning(f"Role slug conflict during update: {role_data['slug']}")
+                    logger.warning("Role slug conflict during update: %s", role_data['slug'])
                     raise ConflictError(f"Role slug '{role_data['slug']}' already exists", "ROLE_SLUG_EXISTS")
 
             # Update the role
@@ -197,7 +197,7 @@ class RoleService:
             if not updated_role:
                 raise InternalServerError("Failed to update role", "ROLE_UPDATE_FAILED")
 
-            logger.info(f"Role {updated_role.name} updated by user {current_user.email}")
+            logger.info("Role %s updated by user %s", updated_role.name, current_user.email)
             
             return ResponseData(
                 success=True,
@@ -214,7 +214,7 @@ class RoleService:
         except (NotFoundError, ConflictError, UnauthorizedError, InternalServerError):
             raise
         except Exception as e:
-            logger.error(f"Error updating role {role_id}: {e}", exc_info=True)
+            logger.error("Error updating role %s: %s", role_id, e, exc_info=True)
             raise InternalServerError("Failed to update role", "ROLE_UPDATE_ERROR")
 
     async def remove_role(self, role_id: int, current_user: User) -> dict:
@@ -226,13 +226,13 @@ class RoleService:
             # Check if role exists
             existing_role = await self.role_dao.get_role_by_id(role_id)
             if not existing_role:
-                logger.warning(f"Role deletion attempt for non-existent ID: {role_id}")
+                logger.warning("Role deletion attempt for non-existent ID: %s", role_id)
                 raise NotFoundError(f"Role with ID {role_id} not found", "ROLE_NOT_FOUND")
 
             # Check if role is being used (business logic)
             is_used = await self._check_role_usage(role_id)
             if is_used:
-                logger.warning(f"Role deletion attempt for role in use: {existing_role.name}")
+                logger.warning("Role deletion attempt for role in use: %s", existing_role.name)
                 raise ConflictError("Cannot delete role - it's currently assigned to users", "ROLE_IN_USE")
 
             # Delete the role
@@ -240,7 +240,7 @@ class RoleService:
             if not success:
                 raise InternalServerError("Failed to delete role", "ROLE_DELETE_FAILED")
 
-            logger.info(f"Role {existing_role.name} deleted by user {current_user.email}")
+            logger.info("Role %s deleted by user %s", existing_role.name, current_user.email)
             
             return ResponseData(
                 success=True,
@@ -250,7 +250,7 @@ class RoleService:
         except (NotFoundError, ConflictError, UnauthorizedError, InternalServerError):
             raise
         except Exception as e:
-            logger.error(f"Error deleting role {role_id}: {e}", exc_info=True)
+            logger.error("Error deleting role %s: %s", role_id, e, exc_info=True)
             raise InternalServerError("Failed to delete role", "ROLE_DELETE_ERROR")
 
     async def assign_permission(self, role_id: int, permission_id: int, current_user: User) -> dict:
@@ -269,7 +269,7 @@ class RoleService:
             if not success:
                 raise ConflictError("Permission is already assigned to this role", "PERMISSION_ALREADY_ASSIGNED")
 
-            logger.info(f"Permission {permission_id} assigned to role {role.name} by user {current_user.email}")
+            logger.info("Permission %s assigned to role %s by user %s", permission_id, role.name, current_user.email)
             
             return ResponseData(
                 success=True,
@@ -284,7 +284,7 @@ class RoleService:
         except (NotFoundError, ConflictError, UnauthorizedError):
             raise
         except Exception as e:
-            logger.error(f"Error assigning permission {permission_id} to role {role_id}: {e}", exc_info=True)
+            logger.error("Error assigning permission %s to role %s: %s", permission_id, role_id, e, exc_info=True)
             raise InternalServerError("Failed to assign permission to role", "PERMISSION_ASSIGNMENT_ERROR")
 
     async def remove_permission(self, role_id: int, permission_id: int, current_user: User) -> dict:
@@ -303,7 +303,7 @@ class RoleService:
             if not success:
                 raise NotFoundError("Permission is not assigned to this role", "PERMISSION_NOT_ASSIGNED")
 
-            logger.info(f"Permission {permission_id} removed from role {role.name} by user {current_user.email}")
+            logger.info("Permission %s removed from role %s by user %s", permission_id, role.name, current_user.email)
             
             return ResponseData(
                 success=True,
@@ -318,7 +318,7 @@ class RoleService:
         except (NotFoundError, UnauthorizedError):
             raise
         except Exception as e:
-            logger.error(f"Error removing permission {permission_id} from role {role_id}: {e}", exc_info=True)
+            logger.error("Error removing permission %s from role %s: %s", permission_id, role_id, e, exc_info=True)
             raise InternalServerError("Failed to remove permission from role", "PERMISSION_REMOVAL_ERROR")
 
     async def _check_role_usage(self, role_id: int) -> bool:
@@ -327,7 +327,7 @@ class RoleService:
             # This would check user_roles or similar table
             return await self.role_dao.is_role_in_use(role_id)
         except Exception as e:
-            logger.warning(f"Could not check role usage: {str(e)}")
+            logger.warning("Could not check role usage: %s", e)
             # If we can't check, assume it's safe to delete
             return False
 
@@ -1,8 +1,12 @@
 # RBAC/dao/team_dao.py
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy import func, update, delete
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.engine import Row
 from typing import Optional
 from roles.models import Role
+from auth.models import User
 
 from teams.models import Team, TeamMember
 from organizations.models import Organization
@@ -42,13 +46,10 @@ class TeamDAO:
             organization.team_count = (organization.team_count or 0) + 1
             self.db.add(organization) # Add to session if changes were made
         else:
-            logger.warn(f"Organization with ID {team_data.organization_id} not found for team count update.")
+            logger.warning("Organization with ID %s not found for team count update.", team_data.organization_id)
 
         await self.db.commit()
-        await self.db.refresh(db_team)
-        if organization: # Refresh organization if it was modified and you need updated state
-             await self.db.refresh(organization)
-        logger.info(f"Team '{db_team.name}' created successfully for organization ID {db_team.organization_id}.")
+        logger.info("Team '%s' created successfully for organization ID %s.", db_team.name, db_team.organization_id)
         return db_team
 
     async def get_team_by_id(self, team_id: int) -> Optional[Team]:
@@ -121,7 +122,7 @@ class TeamDAO:
         """
         existing_member = await self.get_team_member_with_role(user_id, team_id)
         if existing_member:
-            logger.info(f"User ID {user_id} is already a member of team ID {team_id}.")
+            logger.info("User ID %s is already a member of team ID %s.", user_id, team_id)
             return existing_member
 
         new_team_member = TeamMember(
@@ -140,15 +141,95 @@ class TeamDAO:
             team.member_count = (team.member_count or 0) + 1
             self.db.add(team) # Add to session if changes were made
         else:
-            logger.warn(f"Team with ID {team_id} not found for member count update.")
+            logger.warning("Team with ID %s not found for member count update.", team_id)
 
         await self.db.commit()
-        await self.db.refresh(new_team_member)
-        if team: # Refresh team if it was modified
-            await self.db.refresh(team)
-        logger.info(f"User ID {user_id} added to team ID {team_id} with role ID {role_id}.")
+        logger.info("User ID %s added to team ID %s with role ID %s.", user_id, team_id, role_id)
         return new_team_member
 
+    async def get_assignment_context(self, caller_id: int, team_id: int, user_email: str, role_id: int) -> Row:
+        """
+        Fetches everything needed to authorize and perform a team assignment in a single round trip.
+
+        Args:
+            caller_id: The ID of the user performing the assignment.
+            team_id: The ID of the team.
+            user_email: The email of the user to assign.
+            role_id: The ID of the role to assign.
+
+        Returns:
+            A row of (caller_role, team_id, target_user_id, target_user_name, role_name); each is None if not found.
+        """
+        caller_role = (
+            select(Role.name)
+            .join(TeamMember, TeamMember.role_id == Role.id)
+            .where(TeamMember.user_id == caller_id, TeamMember.team_id == team_id)
+            .scalar_subquery()
+        )
+        team = select(Team.id).where(Team.id == team_id).scalar_subquery()
+        target_user_id = select(User.id).where(User.email == user_email).scalar_subquery()
+        target_user_name = (
+            select(func.concat(User.first_name, " ", User.last_name))
+            .where(User.email == user_email)
+            .scalar_subquery()
+        )
+        role_name = select(Role.name).where(Role.id == role_id).scalar_subquery()
+
+        result = await self.db.execute(
+            select(
+                caller_role.label("caller_role"),
+                team.label("team_id"),
+                target_user_id.label("target_user_id"),
+                target_user_name.label("target_user_name"),
+                role_name.label("role_name"),
+            )
+        )
+        return result.one()
+
+    async def insert_team_member(
+            self, team_id: int, user_id: int, role_id: int,
+            user_email: str, user_name: str, role_name: str
+    ) -> Optional[int]:
+        """
+        Inserts a team membership unless one already exists and increments the team's member_count.
+
+        Args:
+            team_id: The ID of the team.
+            user_id: The ID of the user to add.
+            role_id: The ID of the role to assign.
+            user_email: (Denormalized) User's email.
+            user_name: (Denormalized) User's name.
+            role_name: (Denormalized) Role's name.
+
+        Returns:
+            The ID of the new TeamMember row, or None if the user was already a member.
+        """
+        result = await self.db.execute(
+            pg_insert(TeamMember)
+            .values(
+                team_id=team_id,
+                user_id=user_id,
+                role_id=role_id,
+                user_email=user_email,
+                user_name=user_name,
+                role_name=role_name
+            )
+            .on_conflict_do_nothing(index_elements=[TeamMember.team_id, TeamMember.user_id])
+            .returning(TeamMember.id)
+        )
+        team_member_id = result.scalar_one_or_none()
+        if team_member_id is None:
+            return None
+
+        await self.db.execute(
+            update(Team)
+            .where(Team.id == team_id)
+            .values(member_count=func.coalesce(Team.member_count, 0) + 1)
+        )
+        await self.db.commit()
+        logger.info("User ID %s added to team ID %s with role ID %s.", user_id, team_id, role_id)
+        return team_member_id
+
     async def get_team_member(self, user_id: int, team_id: int) -> Optional[TeamMember]:
         """
         Fetches a specific team member record.
@@ -201,10 +282,40 @@ class TeamDAO:
             team.member_count = max(0, (team.member_count or 0) - 1)
             self.db.add(team)
         else:
-            logger.warn(f"Team with ID {team_id} not found for member count update during removal.")
+            logger.warning("Team with ID %s not found for member count update during removal.", team_id)
 
         await self.db.commit()
-        if team:
-            await self.db.refresh(team)
-        logger.info(f"Team member ID {team_member.id} (User ID: {team_member.user_id}, Team ID: {team_id}) removed.")
+        logger.info("Team member ID %s (User ID: %s, Team ID: %s) removed.", team_member.id, team_member.user_id, team_id)
 
+    async def delete_team_member_by_email(self, team_id: int, user_email: str) -> Optional[int]:
+        """
+        Removes a user, identified by email, from a team in a single statement and decrements
+        the team's member_count.
+
+        Args:
+            team_id: The ID of the team.
+            user_email: The email of the user to remove.
+
+        Returns:
+            The ID of the deleted TeamMember row, or None if nothing matched.
+        """
+        result = await self.db.execute(
+            delete(TeamMember)
+            .where(
+                TeamMember.team_id == team_id,
+                TeamMember.user_id == select(User.id).where(User.email == user_email).scalar_subquery()
+            )
+            .returning(TeamMember.id)
+        )
+        team_member_id = result.scalar_one_or_none()
+        if team_member_id is None:
+            return None
+
+        await self.db.execute(
+            update(Team)
+            .where(Team.id == team_id)
+            .values(member_count=func.greatest(func.coalesce(Team.member_count, 0) - 1, 0))
+        )
+        await self.db.commit()
+        logger.info("Team member ID %s (Email: %s, Team ID: %s) removed.", team_member_id, user_email, team_id)
+        return team_member_id
@@ -28,7 +28,7 @@ class TeamService:
 
         if not org_user or not org_user.role or org_user.role.name != "Admin":
             logger.warning(
-                f"User {current_user.id} lacks Admin permissions in organization {team_data.organization_id} to create team."
+                "User %s lacks Admin permissions in organization %s to create team.", current_user.id, team_data.organization_id
             )
             raise HTTPException(status_code=403, detail="Not enough permissions to create team.")
 
@@ -37,10 +37,10 @@ class TeamService:
                 organization_id=team_data.organization_id,
                 name=team_data.name
             )
-            logger.info(f"Team '{db_team.name}' (ID: {db_team.id}) created successfully by user {current_user.id}.")
+            logger.info("Team '%s' (ID: %s) created successfully by user %s.", db_team.name, db_team.id, current_user.id)
             return db_team
         except Exception as e:
-            logger.error(f"Database error creating team: {e}")
+            logger.error("Database error creating team: %s", e)
             raise HTTPException(status_code=500, detail="Failed to create team due to a database error.")
 
 
@@ -48,52 +48,48 @@ class TeamService:
         """
         Assigns a user to a team if the current user is a team admin.
         """
-        current_team_member = await self.team_member_dao.get_team_member(
-            user_id=current_user.id,
-            team_id=team_id
+        context = await self.team_dao.get_assignment_context(
+            caller_id=current_user.id,
+            team_id=team_id,
+            user_email=user_email,
+            role_id=role_id
         )
-        if not current_team_member or not current_team_member.role or current_team_member.role.name != "Team Admin":
+        if context.caller_role != "Team Admin":
             logger.warning(
-                f"User {current_user.id} lacks Team Admin permissions for team {team_id} to assign user."
+                "User %s lacks Team Admin permissions for team %s to assign user.", current_user.id, team_id
             )
             raise HTTPException(status_code=403, detail="Not enough permissions to assign user to this team.")
 
-        team = await self.team_dao.get_team_by_id(team_id)
-        if not team:
-            logger.warning(f"Attempt to assign user to non-existent team ID: {team_id} by user {current_user.id}")
+        if context.team_id is None:
+            logger.warning("Attempt to assign user to non-existent team ID: %s by user %s", team_id, current_user.id)
             raise HTTPException(status_code=404, detail="Team not found.")
 
-        # 3. Fetch the user to be assigned by email
-        user_to_assign = await self.user_dao.get_user_by_email(user_email)
-        if not user_to_assign:
-            logger.warning(f"User with email '{user_email}' not found for team assignment by user {current_user.id}.")
+        if context.target_user_id is None:
+            logger.warning("User with email '%s' not found for team assignment by user %s.", user_email, current_user.id)
             raise HTTPException(status_code=404, detail=f"User with email '{user_email}' not found.")
 
-        # 4. Check if the user is already in the team (optional, but good practice)
-        existing_assignment = await self.team_member_dao.get_team_member(
-            user_id=user_to_assign.id,
-            team_id=team_id
-        )
-        if existing_assignment:
-            logger.info(f"User {user_to_assign.id} is already a member of team {team_id}.")
-            # Depending on requirements, you might raise an error or just return successfully
-            raise HTTPException(status_code=409, detail="User is already a member of this team.")
-            # return # Or simply do nothing if idempotent assignment is desired
-
-        # 5. Assign the user to the team
+        # The insert is a no-op on the (team_id, user_id) unique index when the user is already a member
         try:
-            await self.team_member_dao.add_user_to_team(
-                user_id=user_to_assign.id,
+            team_member_id = await self.team_member_dao.insert_team_member(
                 team_id=team_id,
-                role_id=role_id
-            )
-            logger.info(
-                f"User '{user_email}' (ID: {user_to_assign.id}) assigned to team {team_id} with role {role_id} by user {current_user.id}."
+                user_id=context.target_user_id,
+                role_id=role_id,
+                user_email=user_email,
+                user_name=context.target_user_name,
+                role_name=context.role_name
             )
         except Exception as e:
-            logger.error(f"Database error assigning user to team: {e}")
+            logger.error("Database error assigning user to team: %s", e)
             raise HTTPException(status_code=500, detail="Failed to assign user to team due to a database error.")
 
+        if team_member_id is None:
+            logger.info("User %s is already a member of team %s.", context.target_user_id, team_id)
+            raise HTTPException(status_code=409, detail="User is already a member of this team.")
+
+        logger.info(
+            "User '%s' (ID: %s) assigned to team %s with role %s by user %s.", user_email, context.target_user_id, team_id, role_id, current_user.id
+        )
+
 
     async def remove_user_from_team(self, user_email: str, team_id: int, current_user: User) -> None:
         """
@@ -103,33 +99,30 @@ class TeamService:
         Let's assume for this refactor that the original logic (no specific permission check for remover) is maintained.
         If specific permissions are needed for the *remover*, they should be added here.
         """
-        # 1. Fetch the team to ensure it exists
-        team = await self.team_dao.get_team_by_id(team_id)
-        if not team:
-            logger.warning(f"Attempt to remove user from non-existent team ID: {team_id} by user {current_user.id}")
-            raise HTTPException(status_code=404, detail="Team not found.")
+        try:
+            team_member_id = await self.team_member_dao.delete_team_member_by_email(
+                team_id=team_id,
+                user_email=user_email
+            )
+        except Exception as e:
+            logger.error("Database error removing user from team: %s", e)
+            raise HTTPException(status_code=500, detail="Failed to remove user from team due to a database error.")
 
-        # 2. Fetch the user to be removed by email
-        user_to_remove = await self.user_dao.get_user_by_email(user_email)
-        if not user_to_remove:
-            logger.warning(f"User with email '{user_email}' not found for team removal by user {current_user.id}.")
-            raise HTTPException(status_code=404, detail=f"User with email '{user_email}' not found.")
+        if team_member_id is None:
+            # Nothing was deleted; work out which 404 applies only on this uncommon path
+            team = await self.team_dao.get_team_by_id(team_id)
+            if not team:
+                logger.warning("Attempt to remove user from non-existent team ID: %s by user %s", team_id, current_user.id)
+                raise HTTPException(status_code=404, detail="Team not found.")
+
+            user_to_remove = await self.user_dao.get_user_by_email(user_email)
+            if not user_to_remove:
+                logger.warning("User with email '%s' not found for team removal by user %s.", user_email, current_user.id)
+                raise HTTPException(status_code=404, detail=f"User with email '{user_email}' not found.")
 
-        team_member_to_remove = await self.team_member_dao.get_team_member(
-            user_id=user_to_remove.id,
-            team_id=team_id
-        )
-        if not team_member_to_remove:
             logger.warning(
-                f"User '{user_email}' (ID: {user_to_remove.id}) is not part of team {team_id}. Removal requested by {current_user.id}."
+                "User '%s' (ID: %s) is not part of team %s. Removal requested by %s.", user_email, user_to_remove.id, team_id, current_user.id
             )
             raise HTTPException(status_code=404, detail="User is not part of this team.")
 
-        try:
-            await self.team_member_dao.remove_user_from_team(team_member_to_remove)
-            logger.info(
-                f"User '{user_email}' (ID: {user_to_remove.id}) removed from team {team_id} by user {current_user.id}."
-            )
-        except Exception as e:
-            logger.error(f"Database error removing user from team: {e}")
-            raise HTTPException(status_code=500, detail="Failed to remove user from team due to a database error.")
\ No newline at end of file
+        logger.info("User '%s' removed from team %s by user %s.", user_email, team_id, current_user.id)
\ No newline at end of file
@@ -0,0 +1,82 @@
+import orjson
+import pytest
+from fastapi import HTTPException
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from auth.dependencies import _token_cache_key, get_current_user
+from config.settings import settings
+
+
+EMAIL = "user@example.com"
+TOKEN = "access-token"
+
+
+class FakeRedis:
+    """In-memory stand-in for the shared Redis connection"""
+
+    def __init__(self):
+        self.values = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def setex(self, key, ttl, value):
+        self.values[key] = value
+
+
+class TestCurrentUserCache:
+    """Test suite for the Redis token -> user cache behind get_current_user"""
+
+    @pytest.fixture
+    def redis_client(self):
+        redis = FakeRedis()
+        redis.values[_token_cache_key(TOKEN)] = orjson.dumps(
+            {"id": 1, "email": EMAIL, "first_name": "Test", "last_name": "User",
+             "phone_number": None, "verified": True, "auth_type": None}
+        )
+        return SimpleNamespace(redis=redis)
+
+    @pytest.fixture
+    def db(self):
+        db = MagicMock()
+        db.execute = AsyncMock()
+        return db
+
+    def patch_verify(self, payload):
+        instance = MagicMock()
+        instance.verify_token = AsyncMock(return_value=payload)
+        return patch.object(settings, "auth_instance", instance)
+
+    @pytest.mark.asyncio
+    async def test_cached_user_served_after_verification(self, redis_client, db):
+        """Test a valid token with a cached user skips the database"""
+        with self.patch_verify({"sub": EMAIL, "exp": 2 ** 31}) as instance:
+            user = await get_current_user(TOKEN, db, redis_client)
+
+        assert user.email == EMAIL
+        instance.verify_token.assert_awaited_once_with(TOKEN)
+        db.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_invalid_token_rejected_despite_cached_user(self, redis_client, db):
+        """Test an expired or forged token is rejected even while its user is still cached"""
+        with self.patch_verify(None):
+            with pytest.raises(HTTPException) as exc_info:
+                await get_current_user(TOKEN, db, redis_client)
+
+        assert exc_info.value.status_code == 401
+        db.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_cached_user_for_other_subject_is_ignored(self, redis_client, db):
+        """Test a cached user is only trusted when it matches the token's subject"""
+        result = MagicMock()
+        result.scalars.return_value.first.return_value = None
+        db.execute = AsyncMock(return_value=result)
+
+        with self.patch_verify({"sub": "other@example.com", "exp": 2 ** 31}):
+            with pytest.raises(HTTPException):
+                await get_current_user(TOKEN, db, redis_client)
+
+        db.execute.assert_awaited_once()
@@ -0,0 +1,92 @@
+import time
+
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import auth.utils
+from auth.utils import PASSWORD_CHECK_CACHE_TTL, _verified_passwords, authenticate_user, pwd_context
+
+
+EMAIL = "user@example.com"
+PASSWORD = "Secure@123"
+
+
+class TestPasswordCheckCache:
+    """Test suite for the short-lived cache of successful password checks"""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        _verified_passwords.clear()
+        yield
+        _verified_passwords.clear()
+
+    @pytest.fixture
+    def auth_row(self):
+        return SimpleNamespace(id=1, email=EMAIL, hashed_password=pwd_context.hash(PASSWORD), verified=True)
+
+    @pytest.fixture
+    def dao(self, auth_row):
+        """AuthDAO stub returning auth_row; the fixture value can be mutated between logins"""
+        dao = MagicMock()
+        dao.get_auth_row_by_email = AsyncMock(return_value=auth_row)
+        dao.update_user_password = AsyncMock(return_value=True)
+        with patch("auth.utils.AuthDAO", return_value=dao):
+            yield dao
+
+    @pytest.fixture
+    def verify(self):
+        """Count real password verifications"""
+        with patch("auth.utils.verify_password", AsyncMock(side_effect=auth.utils.verify_password)) as mocked:
+            yield mocked
+
+    @pytest.mark.asyncio
+    async def test_correct_password_is_cached(self, dao, verify, auth_row):
+        """Test a repeat login with the same password skips hashing"""
+        assert await authenticate_user(MagicMock(), EMAIL, PASSWORD) is auth_row
+        assert await authenticate_user(MagicMock(), EMAIL, PASSWORD) is auth_row
+
+        assert verify.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_wrong_password_never_hits_cache(self, dao, verify):
+        """Test a failed check is not cached and a wrong password never matches a cached success"""
+        assert await authenticate_user(MagicMock(), EMAIL, "Wrong@1234") is False
+        assert await authenticate_user(MagicMock(), EMAIL, "Wrong@1234") is False
+        assert verify.await_count == 2
+        assert _verified_passwords._entries == {}
+
+        await authenticate_user(MagicMock(), EMAIL, PASSWORD)
+        assert await authenticate_user(MagicMock(), EMAIL, "Wrong@1234") is False
+        assert verify.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_changed_hash_misses(self, dao, verify, auth_row):
+        """Test a password change invalidates the cached check"""
+        await authenticate_user(MagicMock(), EMAIL, PASSWORD)
+
+        auth_row.hashed_password = pwd_context.hash("Changed@123")
+
+        assert await authenticate_user(MagicMock(), EMAIL, PASSWORD) is False
+        assert verify.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_entry_expires_after_ttl(self, dao, verify, auth_row):
+        """Test a cached check is only trusted for PASSWORD_CHECK_CACHE_TTL seconds"""
+        await authenticate_user(MagicMock(), EMAIL, PASSWORD)
+
+        with patch("time.time", return_value=time.time() + PASSWORD_CHECK_CACHE_TTL - 1):
+            await authenticate_user(MagicMock(), EMAIL, PASSWORD)
+        assert verify.await_count == 1
+
+        with patch("time.time", return_value=time.time() + PASSWORD_CHECK_CACHE_TTL + 1):
+            assert await authenticate_user(MagicMock(), EMAIL, PASSWORD) is auth_row
+        assert verify.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_is_per_email(self, dao, verify):
+        """Test a cached check for one account does not vouch for another"""
+        await authenticate_user(MagicMock(), EMAIL, PASSWORD)
+        await authenticate_user(MagicMock(), "other@example.com", PASSWORD)
+
+        assert verify.await_count == 2
@@ -0,0 +1,91 @@
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from passlib.hash import bcrypt
+
+from auth.utils import _verified_passwords, authenticate_user, pwd_context
+
+
+EMAIL = "user@example.com"
+PASSWORD = "Secure@123"
+
+
+class TestPasswordRehash:
+    """Test suite for upgrading legacy bcrypt hashes to Argon2id on login"""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        _verified_passwords.clear()
+        yield
+        _verified_passwords.clear()
+
+    def make_dao(self, hashed_password):
+        dao = MagicMock()
+        dao.get_auth_row_by_email = AsyncMock(
+            return_value=SimpleNamespace(id=1, email=EMAIL, hashed_password=hashed_password, verified=True)
+        )
+        dao.update_user_password = AsyncMock(return_value=True)
+        return dao
+
+    def test_new_hashes_are_argon2id(self):
+        """Test new hashes use Argon2id and need no upgrade"""
+        hashed = pwd_context.hash(PASSWORD)
+
+        assert hashed.startswith("$argon2id$")
+        assert not pwd_context.needs_update(hashed)
+
+    def test_bcrypt_hashes_still_verify(self):
+        """Test existing bcrypt hashes verify but are flagged for upgrade"""
+        hashed = bcrypt.hash(PASSWORD)
+
+        assert pwd_context.verify(PASSWORD, hashed)
+        assert pwd_context.needs_update(hashed)
+
+    @pytest.mark.asyncio
+    async def test_bcrypt_hash_is_replaced_on_login(self):
+        """Test a successful login with a bcrypt hash stores an Argon2id hash of the same password"""
+        dao = self.make_dao(bcrypt.hash(PASSWORD))
+
+        with patch("auth.utils.AuthDAO", return_value=dao):
+            user = await authenticate_user(MagicMock(), EMAIL, PASSWORD)
+
+        assert user is not False
+        dao.update_user_password.assert_awaited_once()
+        email, new_hash = dao.update_user_password.await_args.args
+        assert email == EMAIL
+        assert new_hash.startswith("$argon2id$")
+        assert pwd_context.verify(PASSWORD, new_hash)
+        assert not pwd_context.needs_update(new_hash)
+
+    @pytest.mark.asyncio
+    async def test_wrong_password_does_not_rehash(self):
+        """Test a failed login leaves the stored bcrypt hash alone"""
+        dao = self.make_dao(bcrypt.hash(PASSWORD))
+
+        with patch("auth.utils.AuthDAO", return_value=dao):
+            assert await authenticate_user(MagicMock(), EMAIL, "Wrong@1234") is False
+
+        dao.update_user_password.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_current_hash_is_not_rewritten(self):
+        """Test an up-to-date Argon2id hash is left untouched"""
+        dao = self.make_dao(pwd_context.hash(PASSWORD))
+
+        with patch("auth.utils.AuthDAO", return_value=dao):
+            assert await authenticate_user(MagicMock(), EMAIL, PASSWORD) is not False
+
+        dao.update_user_password.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_failed_rehash_still_logs_in(self):
+        """Test a database error while upgrading the hash does not fail the login, and is retried next time"""
+        dao = self.make_dao(bcrypt.hash(PASSWORD))
+        dao.update_user_password = AsyncMock(side_effect=RuntimeError("database unavailable"))
+
+        with patch("auth.utils.AuthDAO", return_value=dao):
+            assert await authenticate_user(MagicMock(), EMAIL, PASSWORD) is not False
+            assert await authenticate_user(MagicMock(), EMAIL, PASSWORD) is not False
+
+        assert dao.update_user_password.await_count == 2
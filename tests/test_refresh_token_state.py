@@ -0,0 +1,181 @@
+import time
+
+import jwt
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from auth.services import (
+    AuthService,
+    REFRESH_TOKEN_NEGATIVE_CACHE_TTL,
+    REFRESH_TOKEN_SHARED_CACHE_TTL,
+    _decoded_refresh_tokens,
+    _refresh_token_state_key,
+    _refresh_token_states,
+)
+from config.settings import settings
+from utils.exceptions import InternalServerError, UnauthorizedError
+
+
+class FakeRedis:
+    """In-memory stand-in for the shared Redis connection; TTLs are recorded, not enforced"""
+
+    def __init__(self):
+        self.values = {}
+        self.ttls = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, ex=None, nx=False):
+        if nx and key in self.values:
+            return None
+        self.values[key] = value
+        self.ttls[key] = ex
+        return True
+
+
+def make_service(redis, token_active=True):
+    """AuthService for one worker, backed by the given (shared) Redis and a stubbed DAO"""
+    service = AuthService(db=MagicMock(), redis_client=SimpleNamespace(redis=redis))
+    service.auth_dao = MagicMock()
+    service.auth_dao.is_refresh_token_active = AsyncMock(return_value=token_active)
+    service.auth_dao.delete_refresh_token = AsyncMock(return_value=True)
+    return service
+
+
+def make_refresh_token(email="user@example.com"):
+    exp = int(time.time()) + 3600
+    token = jwt.encode({"sub": email, "exp": exp}, settings.secret_key, algorithm=settings.algorithm)
+    return token, {"sub": email, "exp": exp}
+
+
+class TestRefreshTokenState:
+    """Test suite for refresh-token validity caching and revocation"""
+
+    @pytest.fixture(autouse=True)
+    def clear_caches(self):
+        _refresh_token_states.clear()
+        _decoded_refresh_tokens.clear()
+        yield
+        _refresh_token_states.clear()
+        _decoded_refresh_tokens.clear()
+
+    @pytest.fixture
+    def auth_instance(self):
+        instance = MagicMock()
+        instance.create_access_token = AsyncMock(return_value="new-access-token")
+        with patch.object(settings, "auth_instance", instance):
+            yield instance
+
+    @pytest.mark.asyncio
+    async def test_active_token_is_cached_in_redis_only(self):
+        """Test a database hit is shared through Redis and never kept in process"""
+        redis = FakeRedis()
+        service = make_service(redis)
+        token, payload = make_refresh_token()
+
+        assert await service._load_refresh_token_state(token, payload) is True
+
+        key = _refresh_token_state_key(token)
+        assert redis.values[key] == "1"
+        assert 0 < redis.ttls[key] <= REFRESH_TOKEN_SHARED_CACHE_TTL
+        assert token not in key
+        assert _refresh_token_states.get(token) is None
+
+    @pytest.mark.asyncio
+    async def test_inactive_token_is_negatively_cached(self):
+        """Test an unknown, revoked or expired token is remembered as unusable"""
+        redis = FakeRedis()
+        service = make_service(redis, token_active=False)
+        token, payload = make_refresh_token()
+
+        assert await service._load_refresh_token_state(token, payload) is False
+        assert redis.values[_refresh_token_state_key(token)] == "0"
+        assert redis.ttls[_refresh_token_state_key(token)] == REFRESH_TOKEN_NEGATIVE_CACHE_TTL
+        assert _refresh_token_states.get(token) is False
+
+    @pytest.mark.asyncio
+    async def test_redis_state_skips_database(self):
+        """Test a state already in Redis answers without querying the database"""
+        redis = FakeRedis()
+        service = make_service(redis)
+        token, payload = make_refresh_token()
+        redis.values[_refresh_token_state_key(token)] = "0"
+
+        assert await service._load_refresh_token_state(token, payload) is False
+        service.auth_dao.is_refresh_token_active.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_redis_error_falls_back_to_database(self):
+        """Test a Redis outage only costs a database lookup"""
+        redis = FakeRedis()
+        redis.get = AsyncMock(side_effect=ConnectionError("redis down"))
+        redis.set = AsyncMock(side_effect=ConnectionError("redis down"))
+        service = make_service(redis)
+        token, payload = make_refresh_token()
+
+        assert await service._load_refresh_token_state(token, payload) is True
+        service.auth_dao.is_refresh_token_active.assert_awaited_once_with(token)
+
+    @pytest.mark.asyncio
+    async def test_revoke_is_seen_by_revoking_worker_immediately(self, auth_instance):
+        """Test revocation clears the local cache and marks the token unusable in Redis"""
+        redis = FakeRedis()
+        service = make_service(redis)
+        token, _ = make_refresh_token()
+
+        await service.refresh_user_token(token)
+        await service.revoke_user_token(token)
+
+        assert redis.values[_refresh_token_state_key(token)] == "0"
+        with pytest.raises(UnauthorizedError):
+            await service.refresh_user_token(token)
+
+    @pytest.mark.asyncio
+    async def test_revoke_is_seen_by_other_workers_on_next_refresh(self, auth_instance):
+        """Test a revoke made through another worker is honoured on this worker's very next refresh"""
+        redis = FakeRedis()
+        this_worker = make_service(redis)
+        other_worker = make_service(redis)
+        token, _ = make_refresh_token()
+        await this_worker.refresh_user_token(token)
+        await this_worker.refresh_user_token(token)
+
+        await other_worker.revoke_user_token(token)
+
+        with pytest.raises(UnauthorizedError):
+            await this_worker.refresh_user_token(token)
+        this_worker.auth_dao.is_refresh_token_active.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_revoke_during_database_read_is_not_overwritten(self):
+        """Test a positive result read before a concurrent revoke cannot replace the revocation"""
+        redis = FakeRedis()
+        reader = make_service(redis)
+        revoker = make_service(redis)
+        token, payload = make_refresh_token()
+
+        async def revoke_then_report_active(_):
+            # The row was still active when read, but the revoke completes before the state is written
+            await revoker.revoke_user_token(token)
+            return True
+
+        reader.auth_dao.is_refresh_token_active = AsyncMock(side_effect=revoke_then_report_active)
+
+        assert await reader._load_refresh_token_state(token, payload) is False
+        assert redis.values[_refresh_token_state_key(token)] == "0"
+        assert _refresh_token_states.get(token) is False
+
+    @pytest.mark.asyncio
+    async def test_revoke_fails_when_shared_state_cannot_be_written(self):
+        """Test a revoke is not reported as successful if Redis could not record it"""
+        redis = FakeRedis()
+        redis.set = AsyncMock(side_effect=ConnectionError("redis down"))
+        service = make_service(redis)
+        token, _ = make_refresh_token()
+
+        with pytest.raises(InternalServerError):
+            await service.revoke_user_token(token)
+        service.auth_dao.delete_refresh_token.assert_not_awaited()
+
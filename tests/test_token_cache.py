@@ -0,0 +1,137 @@
+import pytest
+from unittest.mock import patch
+
+from auth.token_cache import TokenCache, VerifiedTokenCache
+
+
+NOW = 1_000_000.0
+
+
+class TestTokenCache:
+    """Test suite for the bounded in-process token cache"""
+
+    @pytest.fixture
+    def clock(self):
+        """Frozen time.time(); move it with clock.return_value"""
+        with patch("time.time", return_value=NOW) as mocked:
+            yield mocked
+
+    def test_miss_returns_none(self, clock):
+        """Test an unknown token is a miss"""
+        assert TokenCache().get("unknown") is None
+
+    def test_hit_until_expiry(self, clock):
+        """Test an entry is served until its expiry and dropped afterwards"""
+        cache = TokenCache()
+        cache.set("token", "value", NOW + 10)
+
+        clock.return_value = NOW + 9.9
+        assert cache.get("token") == "value"
+
+        clock.return_value = NOW + 10
+        assert cache.get("token") is None
+        assert cache._entries == {}
+
+    def test_negative_value_is_a_hit(self, clock):
+        """Test a cached False is returned as False, not treated as a miss"""
+        cache = TokenCache()
+        cache.set("revoked", False, NOW + 30)
+
+        assert cache.get("revoked") is False
+
+    def test_already_expired_entry_is_not_stored(self, clock):
+        """Test setting an entry whose expiry has passed is a no-op"""
+        cache = TokenCache()
+        cache.set("token", True, NOW)
+        cache.set("other", True, NOW - 1)
+
+        assert cache._entries == {}
+
+    def test_invalidate(self, clock):
+        """Test invalidate removes only the given token"""
+        cache = TokenCache()
+        cache.set("token", True, NOW + 10)
+        cache.set("other", True, NOW + 10)
+
+        cache.invalidate("token")
+        cache.invalidate("never-cached")
+
+        assert cache.get("token") is None
+        assert cache.get("other") is True
+
+    def test_evicts_oldest_when_full(self, clock):
+        """Test the oldest entry is evicted once maxsize is reached"""
+        cache = TokenCache(maxsize=2)
+        cache.set("first", 1, NOW + 10)
+        cache.set("second", 2, NOW + 10)
+        cache.set("third", 3, NOW + 10)
+
+        assert cache.get("first") is None
+        assert cache.get("second") == 2
+        assert cache.get("third") == 3
+
+    def test_raw_token_is_not_kept_as_key(self, clock):
+        """Test entries are keyed by a digest of the token"""
+        cache = TokenCache()
+        cache.set("secret-token", True, NOW + 10)
+
+        assert "secret-token" not in cache._entries
+        assert all(isinstance(key, bytes) and len(key) == 32 for key in cache._entries)
+
+
+class TestVerifiedTokenCache:
+    """Test suite for the verified token payload cache"""
+
+    @pytest.fixture
+    def clock(self):
+        with patch("time.time", return_value=NOW) as mocked:
+            yield mocked
+
+    def test_entry_lives_for_ttl(self, clock):
+        """Test a payload without exp is cached for ttl seconds"""
+        cache = VerifiedTokenCache(ttl=30)
+        cache.set("token", {"sub": "user@example.com"})
+
+        clock.return_value = NOW + 29
+        assert cache.get("token") == {"sub": "user@example.com"}
+
+        clock.return_value = NOW + 30
+        assert cache.get("token") is None
+
+    def test_entry_never_outlives_exp(self, clock):
+        """Test a payload is dropped at its exp even when ttl is longer"""
+        cache = VerifiedTokenCache(ttl=30)
+        cache.set("token", {"sub": "user@example.com", "exp": NOW + 5})
+
+        clock.return_value = NOW + 4
+        assert cache.get("token") is not None
+
+        clock.return_value = NOW + 5
+        assert cache.get("token") is None
+
+    def test_expired_payload_is_not_cached(self, clock):
+        """Test a payload whose exp has already passed is never stored"""
+        cache = VerifiedTokenCache(ttl=30)
+        cache.set("token", {"sub": "user@example.com", "exp": NOW - 1})
+
+        assert cache.get("token") is None
+
+    def test_returns_copies(self, clock):
+        """Test callers cannot mutate the cached payload"""
+        cache = VerifiedTokenCache(ttl=30)
+        payload = {"sub": "user@example.com"}
+        cache.set("token", payload)
+
+        payload["sub"] = "changed@example.com"
+        cache.get("token")["sub"] = "changed@example.com"
+
+        assert cache.get("token") == {"sub": "user@example.com"}
+
+    def test_invalidate(self, clock):
+        """Test an invalidated payload is no longer served"""
+        cache = VerifiedTokenCache(ttl=30)
+        cache.set("token", {"sub": "user@example.com"})
+
+        cache.invalidate("token")
+
+        assert cache.get("token") is None
@@ -1,11 +1,13 @@
+import asyncio
+import time
 from abc import ABC, abstractmethod
 from datetime import timedelta
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 
 class BaseAuth(ABC):
     @abstractmethod
-    async def create_access_token(self, data: dict, expires_delta: timedelta):
+    async def create_access_token(self, data: dict, expires_delta: timedelta, now: Optional[float] = None):
         pass
 
     @abstractmethod
@@ -16,14 +18,34 @@ class BaseAuth(ABC):
         expires_delta: timedelta,
         active_organization_id: Optional[int] = None,
         active_team_id: Optional[int] = None,
-        custom_claims: Optional[Dict[str, Any]] = None
+        custom_claims: Optional[Dict[str, Any]] = None,
+        prefetched_context: Optional[Dict[str, Any]] = None
     ) -> str:
         pass
 
     @abstractmethod
-    async def create_refresh_token(self, data: dict, expires_delta: timedelta, db):
+    async def create_refresh_token(self, data: dict, expires_delta: timedelta, db, now: Optional[float] = None):
         pass
 
     @abstractmethod
     async def verify_token(self, token: str):
-        pass
\ No newline at end of file
+        pass
+
+    async def create_token_pair(
+        self,
+        data: dict,
+        access_expires_delta: timedelta,
+        refresh_expires_delta: timedelta,
+        db: AsyncSession
+    ) -> Tuple[str, str]:
+        """
+        Issue an access token and a refresh token for the same claims, signing both concurrently.
+        Each token gets its own copy of the claims, and both expiries are computed from one clock read.
+        The caller commits the refresh token insert.
+        """
+        now = time.time()
+        access_token, refresh_token = await asyncio.gather(
+            self.create_access_token(dict(data), access_expires_delta, now=now),
+            self.create_refresh_token(dict(data), refresh_expires_delta, db, now=now)
+        )
+        return access_token, refresh_token
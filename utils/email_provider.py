@@ -1,3 +1,4 @@
+import asyncio
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
@@ -5,6 +6,15 @@ from urllib.parse import urlparse
 from utils.custom_logger import logger
 from config.settings import settings
 
+def _smtp_send(host: str, port: int, username: str, password: str, use_tls: bool, msg: MIMEMultipart):
+    """Blocking SMTP exchange; always run in a worker thread so the event loop is never held up"""
+    with smtplib.SMTP(host, port) as server:
+        if use_tls:
+            server.starttls()
+        server.login(username, password)
+        return server.sendmail(msg['From'], msg['To'], msg.as_string())
+
+
 async def send_mail(email: str, subject: str, body_html: str):
     """
     Send an email using the NETCORE SMTP transporter.
@@ -18,7 +28,7 @@ async def send_mail(email: str, subject: str, body_html: str):
         dict: Details of the email sending status (accepted, rejected, response).
     """
     try:
-        logger.info(f"Sending Email via NETCORE SMTP to: {email}, Subject: {subject}")
+        logger.info("Sending Email via NETCORE SMTP to: %s, Subject: %s", email, subject)
 
         # Parse NETCORE SMTP configuration from the URL
         smtp_url = urlparse(settings.smtp_netcore)
@@ -35,22 +45,19 @@ async def send_mail(email: str, subject: str, body_html: str):
         msg['Subject'] = subject
         msg.attach(MIMEText(body_html, 'html'))
 
-        with smtplib.SMTP(smtp_host, smtp_port) as server:
-            if use_tls:
-                server.starttls()
-            server.login(smtp_username, smtp_password)
-
-            response = server.sendmail(msg['From'], email, msg.as_string())
-            logger.info(f"Email sent to {email} successfully via NETCORE SMTP.")
+        response = await asyncio.to_thread(
+            _smtp_send, smtp_host, smtp_port, smtp_username, smtp_password, use_tls, msg
+        )
+        logger.info("Email sent to %s successfully via NETCORE SMTP.", email)
 
-            return {
-                "accepted": [email],
-                "rejected": [],
-                "response": response,
-            }
+        return {
+            "accepted": [email],
+            "rejected": [],
+            "response": response,
+        }
 
     except Exception as e:
-        logger.error(f"Failed to send email to {email} via NETCORE SMTP: {e}")
+        logger.error("Failed to send email to %s via NETCORE SMTP: %s", email, e)
         return {
             "accepted": [],
             "rejected": [email],
@@ -28,7 +28,7 @@ class DataEncryptor:
             self._fernet_instance = Fernet(key_bytes)
             logger.info("DataEncryptor initialized successfully.")
         except Exception as e:
-            logger.error(f"Failed to initialize Fernet with the provided key: {e}")
+            logger.error("Failed to initialize Fernet with the provided key: %s", e)
             raise ValueError(f"Invalid encryption key format or value: {e}")
 
     async def encrypt(self, plain_text: str) -> str:
@@ -48,7 +48,7 @@ class DataEncryptor:
             encrypted_bytes = self._fernet_instance.encrypt(plain_text.encode())
             return encrypted_bytes.decode()
         except Exception as e:
-            logger.error(f"Encryption failed: {e}")
+            logger.error("Encryption failed: %s", e)
             raise ValueError(f"Encryption failed: {e}")
 
     async def decrypt(self, encrypted_text: str) -> str:
@@ -74,6 +74,6 @@ class DataEncryptor:
             logger.error("Decryption failed: Invalid token or key.")
             raise ValueError("Decryption failed: Invalid token or key.")
         except Exception as e:
-            logger.error(f"An unexpected error occurred during decryption: {e}")
+            logger.error("An unexpected error occurred during decryption: %s", e)
             raise ValueError(f"Decryption failed: {e}")
 
@@ -35,7 +35,7 @@ def get_user_permissions(role_name: str, scope: str) -> Dict[str, List[str]]:
         role_permissions = get_role_permissions_from_cache(role_name, scope)
         return role_permissions.get("routes", {})
     except Exception as e:
-        logger.error(f"Error getting user permissions for role {role_name}, scope {scope}: {e}")
+        logger.error("Error getting user permissions for role %s, scope %s: %s", role_name, scope, e)
         return {}
 
 
@@ -63,7 +63,7 @@ def can_user_access_route(role_name: str, scope: str, route: str, method: str) -
         route_permissions = permissions.get(route, [])
         return method.upper() in route_permissions
     except Exception as e:
-        logger.error(f"Error checking route access for {role_name}: {e}")
+        logger.error("Error checking route access for %s: %s", role_name, e)
         return False
 
 
@@ -91,7 +91,7 @@ def get_permissions_by_scope(scope: str) -> Dict:
         all_permissions = get_permissions_from_cache()
         return all_permissions.get(scope, {})
     except Exception as e:
-        logger.error(f"Error getting permissions for scope {scope}: {e}")
+        logger.error("Error getting permissions for scope %s: %s", scope, e)
         return {}
 
 
@@ -109,7 +109,7 @@ def get_available_roles(scope: str) -> List[str]:
         scope_permissions = get_permissions_by_scope(scope)
         return list(scope_permissions.keys())
     except Exception as e:
-        logger.error(f"Error getting available roles for scope {scope}: {e}")
+        logger.error("Error getting available roles for scope %s: %s", scope, e)
         return []
 
 
@@ -128,7 +128,7 @@ def get_routes_for_role(role_name: str, scope: str) -> List[str]:
         permissions = get_user_permissions(role_name, scope)
         return list(permissions.keys())
     except Exception as e:
-        logger.error(f"Error getting routes for role {role_name}, scope {scope}: {e}")
+        logger.error("Error getting routes for role %s, scope %s: %s", role_name, scope, e)
         return []
 
 
@@ -141,7 +141,7 @@ async def refresh_cache():
         await refresh_permissions_cache()
         logger.info("Permissions cache refreshed successfully via utility")
     except Exception as e:
-        logger.error(f"Error refreshing permissions cache: {e}")
+        logger.error("Error refreshing permissions cache: %s", e)
         raise
 
 
@@ -153,7 +153,7 @@ def clear_cache():
         clear_permissions_cache()
         logger.info("Permissions cache cleared successfully via utility")
     except Exception as e:
-        logger.error(f"Error clearing permissions cache: {e}")
+        logger.error("Error clearing permissions cache: %s", e)
         raise
 
 
@@ -33,11 +33,11 @@ def get_effective_permissions(role: str, scope: str) -> dict:
         
         # If permissions found in cache, return them
         if permissions:
-            logger.debug(f"Retrieved effective permissions for role {role}, scope {scope} from cache")
+            logger.debug("Retrieved effective permissions for role %s, scope %s from cache", role, scope)
             return permissions
         
         # Fallback to original logic if cache is empty
-        logger.warning(f"Cache miss for role {role}, scope {scope}, using fallback permissions")
+        logger.warning("Cache miss for role %s, scope %s, using fallback permissions", role, scope)
         
         permissions = {}
         current_role = role
@@ -64,7 +64,7 @@ def get_effective_permissions(role: str, scope: str) -> dict:
         return {route: list(methods) for route, methods in permissions.items()}
         
     except Exception as e:
-        logger.error(f"Error getting effective permissions for role {role}, scope {scope}: {e}")
+        logger.error("Error getting effective permissions for role %s, scope %s: %s", role, scope, e)
         return {}
 
 def get_permissions_from_cache() -> dict:
@@ -139,7 +139,7 @@ class PermissionMiddleware(BaseHTTPMiddleware):
         except HTTPException as e:
             return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
         except Exception as e:
-            logger.error(f"Middleware error: {e}")
+            logger.error("Middleware error: %s", e)
             return JSONResponse(status_code=500, content={"detail": "Internal server error"})
 
     async def get_user_role_in_context(self, user_id: int, scope: str, context_id: int, db: AsyncSession) -> str:
@@ -314,10 +314,10 @@ async def build_permissions():
                 }
             }
         
-        logger.info(f"Permissions cache built successfully with {len(settings.permissions)} scopes")
+        logger.info("Permissions cache built successfully with %s scopes", len(settings.permissions))
         
     except Exception as e:
-        logger.error(f"Error building permissions from database: {str(e)}")
+        logger.error("Error building permissions from database: %s", e)
         # Fallback to hardcoded permissions on error
         settings.permissions = {
             "organization": {
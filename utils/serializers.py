@@ -14,3 +14,14 @@ class ResponseData(BaseModel):
 
     def dict(self, *args, **kwargs):
         return super().model_dump(*args, **kwargs)
+
+
+def response_dict(success: bool, message: str, data: Any = None) -> dict:
+    """Same shape as ResponseData(...).model_dump(), built as a plain dict for hot endpoints"""
+    return {
+        "identifier": str(uuid4()),
+        "success": success,
+        "message": message,
+        "errors": [],
+        "data": [] if data is None else data,
+    }
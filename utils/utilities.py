@@ -1,9 +1,17 @@
 import aiofiles
+import httpx
+import orjson
+from authlib.integrations.starlette_client import OAuth
 from cryptography.hazmat.primitives import serialization
 
 from auth.jwt_auth import JWTAuth
 from auth.paseto_auth import PasetoAuth
 from config.settings import settings
+from db.redis_connection import RedisClient
+from utils.custom_logger import logger
+
+# Provider OpenID discovery documents change rarely, so workers share one copy through Redis
+OAUTH_METADATA_CACHE_TTL = 24 * 60 * 60
 
 async def get_auth_instance():
     if settings.auth_mode == 'jwt':
@@ -34,3 +42,85 @@ async def get_auth_instance():
         return PasetoAuth()
     return None
 
+
+
+class SharedHTTPTransport(httpx.AsyncHTTPTransport):
+    """
+    Connection pool shared by the short-lived httpx clients authlib opens for each OAuth call.
+
+    Closing one of those clients leaves the pool open, so TLS connections to the providers are
+    kept alive between logins; ``close_pool`` shuts it down at application exit.
+    """
+
+    async def __aexit__(self, *args) -> None:
+        return None
+
+    async def aclose(self) -> None:
+        return None
+
+    async def close_pool(self) -> None:
+        await super().aclose()
+
+
+def build_oauth_transport() -> SharedHTTPTransport:
+    return SharedHTTPTransport(limits=httpx.Limits(max_keepalive_connections=100, keepalive_expiry=300))
+
+
+def build_oauth_client(transport: httpx.AsyncBaseTransport) -> OAuth:
+    """Register every OAuth provider on a single client; built once at startup"""
+    oauth = OAuth()
+    oauth.register(
+        name='microsoft',
+        client_id=settings.microsoft_client_id,
+        client_secret=settings.microsoft_client_secret,
+        server_metadata_url='https://login.microsoftonline.com/common/v2.0/.well-known/openid-configuration',
+        client_kwargs={
+            'scope': 'openid email profile',
+            'transport': transport,
+        }
+    )
+    oauth.register(
+        name='google',
+        client_id=settings.google_client_id,
+        client_secret=settings.google_client_secret,
+        server_metadata_url='https://accounts.google.com/.well-known/openid-configuration',
+        client_kwargs={
+            'scope': 'email openid profile',
+            'transport': transport,
+        }
+    )
+    oauth.register(
+        name='github',
+        client_id=settings.github_client_id,
+        client_secret=settings.github_client_secret,
+        access_token_url='https://github.com/login/oauth/access_token',
+        authorize_url='https://github.com/login/oauth/authorize',
+        api_base_url='https://api.github.com/',
+        client_kwargs={'scope': 'user:email', 'transport': transport},
+    )
+    return oauth
+
+
+async def load_oauth_metadata(oauth: OAuth, provider: str, redis_client: RedisClient) -> None:
+    """
+    Load a provider's OpenID discovery document, preferring the copy cached in Redis.
+
+    The cached document carries authlib's ``_loaded_at`` marker, so once it is applied the client
+    never fetches ``server_metadata_url`` itself.
+    """
+    client = getattr(oauth, provider)
+    cache_key = f"oauth_metadata:{provider}"
+    try:
+        cached = await redis_client.redis.get(cache_key)
+    except Exception as e:
+        logger.error("OAuth metadata cache lookup failed for %s: %s", provider, e)
+        cached = None
+    if cached:
+        client.server_metadata.update(orjson.loads(cached))
+        return
+
+    metadata = await client.load_server_metadata()
+    try:
+        await redis_client.redis.setex(cache_key, OAUTH_METADATA_CACHE_TTL, orjson.dumps(metadata))
+    except Exception as e:
+        logger.error("OAuth metadata cache write failed for %s: %s", provider, e)